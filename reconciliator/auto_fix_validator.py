@@ -6,10 +6,7 @@ Runs validation and automatically fixes ID errors where possible.
 
 import sys
 import os
-import json
-import re
-from datetime import datetime
-from copy import deepcopy
+from typing import NamedTuple
 
 sys.path.append(os.path.dirname(__file__))
 
@@ -21,6 +18,37 @@ from reconciliator import (
     BACKUPS_DIR, create_backup, normalize_name
 )
 
+# Shared default for missing materials/outputs, so no empty list is built per craft
+_EMPTY = ()
+
+class ReferenceFix(NamedTuple):
+    """Broken craft reference that can be pointed at an existing item"""
+    craft_id: str
+    craft_name: str
+    section: str
+    index: int
+    old_ref: str
+    new_ref: str
+    existing_item_name: str
+
+class CreateItemFix(NamedTuple):
+    """Broken craft reference that needs a new item created"""
+    craft_id: str
+    craft_name: str
+    section: str
+    index: int
+    broken_ref: str
+    new_item: dict
+
+class ProfessionFix(NamedTuple):
+    """Item whose ID uses a different profession than the craft creating it"""
+    old_id: str
+    new_id: str
+    item_name: str
+    old_profession: str
+    new_profession: str
+    item: dict
+
 class AutoFixValidator:
     """Enhanced validator that can automatically fix common ID issues"""
     
@@ -39,61 +67,78 @@ class AutoFixValidator:
         
         # Create lookups for efficient searching
         self.item_lookup = {item.get('id'): item for item in self.items_data if item.get('id')}
-        self.item_name_lookup = {item.get('name', '').lower(): item for item in self.items_data if item.get('name')}
         self.craft_lookup = {craft.get('id'): craft for craft in self.crafts_data if craft.get('id')}
         
+        # Suggestions by broken reference - the same broken ID tends to
+        # appear in many crafts, so each one is only resolved once
+        self._fix_cache = {}
+        self._rebuild_item_index()
+        # Set once profession fixes rename item IDs (see DataIntegrityValidator.from_autofix)
+        self._item_ids_renamed = False
+    
+    def _rebuild_item_index(self):
+        """Refresh the lookups derived from item_lookup after it changes"""
+        # Frozen ID set for the membership checks in the reference scans
+        self._item_id_set = frozenset(self.item_lookup)
+        # Lowercased names, computed once instead of on every suggestion
+        self._item_names_lower = [
+            (item_id, item.get('name', '').lower()) for item_id, item in self.item_lookup.items()
+        ]
+        self._fix_cache.clear()
+        
     def suggest_item_id_fix(self, broken_ref):
         """Suggest a fix for a broken item reference"""
-        if not broken_ref or ':' not in broken_ref:
+        if broken_ref in self._fix_cache:
+            return self._fix_cache[broken_ref]
+        
+        suggestion = self._find_item_id_fix(broken_ref)
+        self._fix_cache[broken_ref] = suggestion
+        return suggestion
+    
+    def _find_item_id_fix(self, broken_ref):
+        """Search existing items for the best match to a broken reference"""
+        if not broken_ref:
             return None
             
-        # Extract the item name from the broken ID
-        parts = broken_ref.split(':')
-        if len(parts) < 3:
+        # Extract the item name from the broken ID (needs at least 3 segments)
+        _, sep, rest = broken_ref.partition(':')
+        if not sep or ':' not in rest:
             return None
             
-        item_name_part = parts[-1].replace('-', ' ').title()
+        item_name_part = rest.rpartition(':')[2].replace('-', ' ').lower()
+        plain_name = f"plain {item_name_part}"
         
-        # Look for fuzzy matches in existing items
-        best_matches = []
+        # Single pass: an exact match wins outright, then a "Plain" prefix
+        # variation, then the first fuzzy match
+        plain_match = None
+        fuzzy_match = None
         
-        for existing_id, item in self.item_lookup.items():
-            item_name = item.get('name', '')
-            
+        for existing_id, item_name in self._item_names_lower:
             # Exact name match (case insensitive)
-            if item_name.lower() == item_name_part.lower():
+            if item_name == item_name_part:
                 return existing_id
+            
+            if plain_match is None and item_name == plain_name:
+                plain_match = existing_id
                 
             # Fuzzy name match (contains or similar)
-            if (item_name_part.lower() in item_name.lower() or 
-                item_name.lower() in item_name_part.lower()):
-                best_matches.append((existing_id, item_name))
-        
-        # Try "Plain" prefix variations
-        plain_name = f"Plain {item_name_part}"
-        for existing_id, item in self.item_lookup.items():
-            item_name = item.get('name', '')
-            if item_name.lower() == plain_name.lower():
-                return existing_id
+            if fuzzy_match is None and (item_name_part in item_name or item_name in item_name_part):
+                fuzzy_match = existing_id
         
-        # Return best fuzzy match if found
-        if best_matches:
-            return best_matches[0][0]
-            
-        return None
+        return plain_match or fuzzy_match
     
     def create_missing_item(self, broken_ref, context="unknown"):
         """Create a missing item based on broken reference"""
-        if not broken_ref or ':' not in broken_ref:
+        if not broken_ref:
             return None
             
-        parts = broken_ref.split(':')
-        if len(parts) < 3:
+        entity_type, sep, rest = broken_ref.partition(':')
+        if not sep:
             return None
-            
-        entity_type = parts[0]
-        profession = parts[1]
-        item_name_slug = parts[2]
+        profession, sep, rest = rest.partition(':')
+        if not sep:
+            return None
+        item_name_slug = rest.partition(':')[0]
         
         if entity_type != 'item':
             return None
@@ -112,6 +157,49 @@ class AutoFixValidator:
         
         return new_item
     
+    def scan_craft(self, craft):
+        """Collect fixes for the broken item references of a single craft"""
+        valid_ids = self._item_id_set
+        
+        # Most crafts are clean - skip them without walking each entry
+        refs = {entry.get('item') for section in ('materials', 'outputs') for entry in craft.get(section) or _EMPTY}
+        refs.discard(None)
+        refs.discard('')
+        if refs <= valid_ids:
+            return []
+        
+        fixes = []
+        craft_id = craft.get('id', 'unknown')
+        craft_name = craft.get('name', 'unknown')
+        suggest = self.suggest_item_id_fix
+        
+        # Materials and outputs are checked the same way
+        for section, context in (('materials', 'material'), ('outputs', 'output')):
+            entries = craft.get(section)
+            if not entries:
+                continue
+            
+            for i, entry in enumerate(entries):
+                item_ref = entry.get('item', '')
+                if not item_ref or item_ref in valid_ids:
+                    continue
+                
+                # Try to find a fix
+                suggested_fix = suggest(item_ref)
+                
+                if suggested_fix:
+                    fixes.append(ReferenceFix(
+                        craft_id, craft_name, section, i, item_ref, suggested_fix,
+                        self.item_lookup[suggested_fix].get('name', '')
+                    ))
+                else:
+                    # Create missing item
+                    new_item = self.create_missing_item(item_ref, f"craft {craft_name} {context}")
+                    if new_item:
+                        fixes.append(CreateItemFix(craft_id, craft_name, section, i, item_ref, new_item))
+        
+        return fixes
+    
     def fix_broken_item_references(self, dry_run=False):
         """Find and fix broken item references in crafts"""
         fixes = []
@@ -119,86 +207,15 @@ class AutoFixValidator:
         print(f"\n{Colors.header('🔧 ANALYZING BROKEN ITEM REFERENCES')}")
         
         for craft in self.crafts_data:
-            craft_id = craft.get('id', 'unknown')
-            craft_name = craft.get('name', 'unknown')
-            
-            # Check materials
-            if 'materials' in craft:
-                for i, material in enumerate(craft['materials']):
-                    item_ref = material.get('item', '')
-                    if item_ref and item_ref not in self.item_lookup:
-                        # Try to find a fix
-                        suggested_fix = self.suggest_item_id_fix(item_ref)
-                        
-                        if suggested_fix:
-                            fix_info = {
-                                'type': 'reference_fix',
-                                'craft_id': craft_id,
-                                'craft_name': craft_name,
-                                'section': 'materials',
-                                'index': i,
-                                'old_ref': item_ref,
-                                'new_ref': suggested_fix,
-                                'existing_item_name': self.item_lookup[suggested_fix].get('name', '')
-                            }
-                            fixes.append(fix_info)
-                        else:
-                            # Create missing item
-                            new_item = self.create_missing_item(item_ref, f"craft {craft_name} material")
-                            if new_item:
-                                fix_info = {
-                                    'type': 'create_item',
-                                    'craft_id': craft_id,
-                                    'craft_name': craft_name,
-                                    'section': 'materials',
-                                    'index': i,
-                                    'broken_ref': item_ref,
-                                    'new_item': new_item
-                                }
-                                fixes.append(fix_info)
-            
-            # Check outputs
-            if 'outputs' in craft:
-                for i, output in enumerate(craft['outputs']):
-                    item_ref = output.get('item', '')
-                    if item_ref and item_ref not in self.item_lookup:
-                        # Try to find a fix
-                        suggested_fix = self.suggest_item_id_fix(item_ref)
-                        
-                        if suggested_fix:
-                            fix_info = {
-                                'type': 'reference_fix',
-                                'craft_id': craft_id,
-                                'craft_name': craft_name,
-                                'section': 'outputs',
-                                'index': i,
-                                'old_ref': item_ref,
-                                'new_ref': suggested_fix,
-                                'existing_item_name': self.item_lookup[suggested_fix].get('name', '')
-                            }
-                            fixes.append(fix_info)
-                        else:
-                            # Create missing item
-                            new_item = self.create_missing_item(item_ref, f"craft {craft_name} output")
-                            if new_item:
-                                fix_info = {
-                                    'type': 'create_item',
-                                    'craft_id': craft_id,
-                                    'craft_name': craft_name,
-                                    'section': 'outputs',
-                                    'index': i,
-                                    'broken_ref': item_ref,
-                                    'new_item': new_item
-                                }
-                                fixes.append(fix_info)
+            fixes.extend(self.scan_craft(craft))
         
         if not fixes:
             print(f"   {Colors.success('✅ No broken item references found!')}")
             return []
         
         # Show what will be fixed
-        reference_fixes = [f for f in fixes if f['type'] == 'reference_fix']
-        create_fixes = [f for f in fixes if f['type'] == 'create_item']
+        reference_fixes = [f for f in fixes if isinstance(f, ReferenceFix)]
+        create_fixes = [f for f in fixes if isinstance(f, CreateItemFix)]
         
         print(f"   {Colors.info(f'Found {len(fixes)} issues to fix:')}")
         print(f"   • {Colors.colorize(str(len(reference_fixes)), Colors.YELLOW)} reference corrections")
@@ -216,34 +233,34 @@ class AutoFixValidator:
     def _preview_fixes(self, fixes):
         """Preview what fixes would be applied"""
         for fix in fixes:
-            if fix['type'] == 'reference_fix':
-                print(f"   {Colors.colorize('🔗', Colors.YELLOW)} {fix['craft_name']} ({fix['section']})")
-                print(f"      {Colors.colorize(fix['old_ref'], Colors.RED)} → {Colors.colorize(fix['new_ref'], Colors.GREEN)}")
-                print(f"      Reason: Found existing item '{fix['existing_item_name']}'")
+            if isinstance(fix, ReferenceFix):
+                print(f"   {Colors.colorize('🔗', Colors.YELLOW)} {fix.craft_name} ({fix.section})")
+                print(f"      {Colors.colorize(fix.old_ref, Colors.RED)} → {Colors.colorize(fix.new_ref, Colors.GREEN)}")
+                print(f"      Reason: Found existing item '{fix.existing_item_name}'")
             
-            elif fix['type'] == 'create_item':
-                new_item = fix['new_item']
+            elif isinstance(fix, CreateItemFix):
+                new_item = fix.new_item
                 print(f"   {Colors.colorize('➕', Colors.GREEN)} Create missing item: {Colors.highlight(new_item['id'])}")
                 print(f"      Name: {new_item['name']}")
-                print(f"      Used by: {fix['craft_name']} ({fix['section']})")
+                print(f"      Used by: {fix.craft_name} ({fix.section})")
     
     def _apply_fixes(self, fixes):
         """Actually apply the fixes to the data"""
         items_to_create = []
         
         for fix in fixes:
-            if fix['type'] == 'reference_fix':
+            if isinstance(fix, ReferenceFix):
                 # Update the craft reference
-                craft = self.craft_lookup.get(fix['craft_id'])
-                if craft and fix['section'] in craft:
-                    craft[fix['section']][fix['index']]['item'] = fix['new_ref']
-                    print(f"   {Colors.colorize('✓', Colors.GREEN)} Fixed reference in {fix['craft_name']}")
-                    print(f"      {Colors.gray(f'{fix['old_ref']} → {fix['new_ref']}')}")
+                craft = self.craft_lookup.get(fix.craft_id)
+                if craft and fix.section in craft:
+                    craft[fix.section][fix.index]['item'] = fix.new_ref
+                    print(f"   {Colors.colorize('✓', Colors.GREEN)} Fixed reference in {fix.craft_name}")
+                    print(f"      {Colors.gray(f'{fix.old_ref} → {fix.new_ref}')}")
                     self.references_fixed.append(fix)
             
-            elif fix['type'] == 'create_item':
-                items_to_create.append(fix['new_item'])
-                self.items_created.append(fix['new_item'])
+            elif isinstance(fix, CreateItemFix):
+                items_to_create.append(fix.new_item)
+                self.items_created.append(fix.new_item)
         
         # Add new items to the items data
         if items_to_create:
@@ -252,6 +269,7 @@ class AutoFixValidator:
                 self.item_lookup[new_item['id']] = new_item
                 print(f"   {Colors.colorize('✓', Colors.GREEN)} Created item: {Colors.highlight(new_item['id'])}")
                 print(f"      Name: {new_item['name']}")
+            self._rebuild_item_index()
         
         self.fixes_applied.extend(fixes)
     
@@ -270,7 +288,7 @@ class AutoFixValidator:
                 craft_profession = craft_id.split(':')[1]
                 
                 # Map output items to this profession
-                for output in craft.get('outputs', []):
+                for output in craft.get('outputs', _EMPTY):
                     item_ref = output.get('item', '')
                     if item_ref:
                         item_to_creating_profession[item_ref] = craft_profession
@@ -295,17 +313,11 @@ class AutoFixValidator:
                 correct_id = f"item:{creating_profession}:{parts[2]}"
                 
                 # Check if the correct ID already exists
-                if correct_id not in self.item_lookup:
-                    fix_info = {
-                        'type': 'profession_fix',
-                        'old_id': item_id,
-                        'new_id': correct_id,
-                        'item_name': item_name,
-                        'old_profession': current_profession,
-                        'new_profession': creating_profession,
-                        'item': item
-                    }
-                    fixes.append(fix_info)
+                if correct_id not in self._item_id_set:
+                    fixes.append(ProfessionFix(
+                        item_id, correct_id, item_name,
+                        current_profession, creating_profession, item
+                    ))
         
         if not fixes:
             print(f"   {Colors.success('✅ No profession inconsistencies found!')}")
@@ -325,38 +337,41 @@ class AutoFixValidator:
     def _preview_profession_fixes(self, fixes):
         """Preview profession fixes"""
         for fix in fixes:
-            print(f"   {Colors.colorize('🔄', Colors.CYAN)} {fix['item_name']}")
-            print(f"      {Colors.colorize(fix['old_id'], Colors.RED)} → {Colors.colorize(fix['new_id'], Colors.GREEN)}")
-            print(f"      Profession: {fix['old_profession']} → {fix['new_profession']}")
+            print(f"   {Colors.colorize('🔄', Colors.CYAN)} {fix.item_name}")
+            print(f"      {Colors.colorize(fix.old_id, Colors.RED)} → {Colors.colorize(fix.new_id, Colors.GREEN)}")
+            print(f"      Profession: {fix.old_profession} → {fix.new_profession}")
     
     def _apply_profession_fixes(self, fixes):
         """Apply profession fixes"""
         for fix in fixes:
             # Update the item ID
-            old_item = fix['item']
-            old_item['id'] = fix['new_id']
+            old_item = fix.item
+            old_item['id'] = fix.new_id
             
             # Update lookups
-            if fix['old_id'] in self.item_lookup:
-                del self.item_lookup[fix['old_id']]
-            self.item_lookup[fix['new_id']] = old_item
+            self._item_ids_renamed = True
+            if fix.old_id in self.item_lookup:
+                del self.item_lookup[fix.old_id]
+            self.item_lookup[fix.new_id] = old_item
             
             # Update all craft references to this item
             for craft in self.crafts_data:
                 # Update materials
-                for material in craft.get('materials', []):
-                    if material.get('item') == fix['old_id']:
-                        material['item'] = fix['new_id']
+                for material in craft.get('materials', _EMPTY):
+                    if material.get('item') == fix.old_id:
+                        material['item'] = fix.new_id
                 
                 # Update outputs
-                for output in craft.get('outputs', []):
-                    if output.get('item') == fix['old_id']:
-                        output['item'] = fix['new_id']
+                for output in craft.get('outputs', _EMPTY):
+                    if output.get('item') == fix.old_id:
+                        output['item'] = fix.new_id
             
-            print(f"   {Colors.colorize('✓', Colors.GREEN)} Fixed profession for: {fix['item_name']}")
-            print(f"      {Colors.gray(f'{fix['old_id']} → {fix['new_id']}')}")
+            print(f"   {Colors.colorize('✓', Colors.GREEN)} Fixed profession for: {fix.item_name}")
+            print(f"      {Colors.gray(f'{fix.old_id} → {fix.new_id}')}")
             
             self.fixes_applied.append(fix)
+        
+        self._rebuild_item_index()
     
     def save_fixes_to_files(self):
         """Save the fixed data back to files"""
@@ -368,12 +383,12 @@ class AutoFixValidator:
         
         try:
             # Save items
-            if any(f['type'] in ['create_item', 'profession_fix'] for f in self.fixes_applied):
+            if any(isinstance(f, (CreateItemFix, ProfessionFix)) for f in self.fixes_applied):
                 save_json(ITEMS_DATA_PATH, self.items_data)
                 print(f"   {Colors.colorize('✓', Colors.GREEN)} Saved {Colors.highlight('items.json')}")
             
             # Save crafts
-            if any(f['type'] == 'reference_fix' for f in self.fixes_applied):
+            if any(isinstance(f, ReferenceFix) for f in self.fixes_applied):
                 save_json(CRAFTS_DATA_PATH, self.crafts_data)
                 print(f"   {Colors.colorize('✓', Colors.GREEN)} Saved {Colors.highlight('crafts.json')}")
             
@@ -387,9 +402,9 @@ class AutoFixValidator:
         """Print summary of all fixes applied"""
         print(f"\n{Colors.section_divider('AUTO-FIX SUMMARY', 60)}")
         
-        reference_fixes = len([f for f in self.fixes_applied if f['type'] == 'reference_fix'])
-        profession_fixes = len([f for f in self.fixes_applied if f['type'] == 'profession_fix'])
-        items_created = len([f for f in self.fixes_applied if f['type'] == 'create_item'])
+        reference_fixes = len([f for f in self.fixes_applied if isinstance(f, ReferenceFix)])
+        profession_fixes = len([f for f in self.fixes_applied if isinstance(f, ProfessionFix)])
+        items_created = len([f for f in self.fixes_applied if isinstance(f, CreateItemFix)])
         
         print(f"  {Colors.highlight('Fixes Applied:')} {Colors.bold(str(len(self.fixes_applied)))}")
         print(f"  • {Colors.colorize(str(reference_fixes), Colors.YELLOW)} reference corrections")
@@ -479,10 +494,7 @@ def main():
         
         # Run final validation
         print(f"\n6. Running final validation...")
-        final_validator = DataIntegrityValidator(
-            validator.items_data, validator.crafts_data, requirements_data,
-            professions_meta, tools_meta, buildings_meta
-        )
+        final_validator = DataIntegrityValidator.from_autofix(validator)
         
         is_valid = final_validator.run_all_validations()
         
@@ -1,45 +1,87 @@
 import os
 import json
+import logging
 import re
 import sys
-from copy import deepcopy
+from bisect import insort
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 import shutil
 try:
-    from deepdiff import DeepDiff
+    import orjson
 except ImportError:
-    DeepDiff = None  # Will warn if diffing is attempted without it
+    orjson = None  # Falls back to the stdlib json module
 
-# Import ExportManager for intelligent craft comparison
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from bitcrafty_extractor.export.export_manager import ExportManager
+# Per-item progress from the normalization passes; configured in __main__
+log = logging.getLogger(__name__)
+
+def _stdout_supports_color():
+    """ANSI colors only when writing to a terminal; NO_COLOR / FORCE_COLOR override the check."""
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    isatty = getattr(sys.stdout, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def _ansi(code):
+    """Return the escape code, or nothing when output is piped to a file."""
+    return code if _USE_COLOR else ''
+
+
+_USE_COLOR = _stdout_supports_color()
 
 # Color codes for CLI output
 class Colors:
     """ANSI color codes for terminal output"""
     # Text colors
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    GRAY = '\033[90m'
+    RED = _ansi('\033[91m')
+    GREEN = _ansi('\033[92m')
+    YELLOW = _ansi('\033[93m')
+    BLUE = _ansi('\033[94m')
+    MAGENTA = _ansi('\033[95m')
+    CYAN = _ansi('\033[96m')
+    WHITE = _ansi('\033[97m')
+    GRAY = _ansi('\033[90m')
     
     # Background colors
-    BG_RED = '\033[101m'
-    BG_GREEN = '\033[102m'
-    BG_YELLOW = '\033[103m'
-    BG_BLUE = '\033[104m'
+    BG_RED = _ansi('\033[101m')
+    BG_GREEN = _ansi('\033[102m')
+    BG_YELLOW = _ansi('\033[103m')
+    BG_BLUE = _ansi('\033[104m')
     
     # Formatting
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
-    ITALIC = '\033[3m'
+    BOLD = _ansi('\033[1m')
+    UNDERLINE = _ansi('\033[4m')
+    ITALIC = _ansi('\033[3m')
     
     # Reset
-    RESET = '\033[0m'
+    RESET = _ansi('\033[0m')
+    
+    # Bold color combinations, joined once
+    BOLD_RED = BOLD + RED
+    BOLD_GREEN = BOLD + GREEN
+    BOLD_YELLOW = BOLD + YELLOW
+    BOLD_MAGENTA = BOLD + MAGENTA
+    BOLD_CYAN = BOLD + CYAN
+    
+    # Prebuilt prefixes for the message helpers below
+    _SUCCESS_PREFIX = f"{GREEN}✅ "
+    _ERROR_PREFIX = f"{RED}❌ "
+    _WARNING_PREFIX = f"{YELLOW}⚠️  "
+    _INFO_PREFIX = f"{BLUE}ℹ️  "
+    _HEADER_PREFIX = BOLD_CYAN
+    
+    # Prebuilt markers for the per-entry lines of the detailed change and apply output
+    CHECK = f"{GREEN}✓{RESET}"
+    PLUS = f"{GREEN}+{RESET}"
+    WARNING_MARK = f"{YELLOW}⚠️{RESET}"
+    NOTE = f"{CYAN}📝{RESET}"
     
     @staticmethod
     def colorize(text, color):
@@ -49,28 +91,33 @@ class Colors:
     @staticmethod
     def success(text):
         """Green success message"""
-        return f"{Colors.GREEN}✅ {text}{Colors.RESET}"
+        return f"{Colors._SUCCESS_PREFIX}{text}{Colors.RESET}"
     
     @staticmethod
     def error(text):
         """Red error message"""
-        return f"{Colors.RED}❌ {text}{Colors.RESET}"
+        return f"{Colors._ERROR_PREFIX}{text}{Colors.RESET}"
     
     @staticmethod
     def warning(text):
         """Yellow warning message"""
-        return f"{Colors.YELLOW}⚠️  {text}{Colors.RESET}"
+        return f"{Colors._WARNING_PREFIX}{text}{Colors.RESET}"
     
     @staticmethod
     def info(text):
         """Blue info message"""
-        return f"{Colors.BLUE}ℹ️  {text}{Colors.RESET}"
+        return f"{Colors._INFO_PREFIX}{text}{Colors.RESET}"
     
     @staticmethod
     def highlight(text):
         """Cyan highlighted text"""
         return f"{Colors.CYAN}{text}{Colors.RESET}"
     
+    @staticmethod
+    def label(text):
+        """Cyan field label ("Name:", "Reason:")"""
+        return f"{Colors.CYAN}{text}{Colors.RESET}"
+    
     @staticmethod
     def bold(text):
         """Bold text"""
@@ -79,7 +126,7 @@ class Colors:
     @staticmethod
     def header(text):
         """Bold cyan header"""
-        return f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.RESET}"
+        return f"{Colors._HEADER_PREFIX}{text}{Colors.RESET}"
     
     @staticmethod
     def gray(text):
@@ -93,7 +140,7 @@ class Colors:
         divider = "=" * padding + f" {title} " + "=" * padding
         if len(divider) < width:
             divider += "="
-        return Colors.colorize(divider, Colors.BOLD + Colors.MAGENTA)
+        return Colors.colorize(divider, Colors.BOLD_MAGENTA)
 
     @staticmethod
     def get_tier_color(tier):
@@ -161,20 +208,59 @@ def load_json(path):
     if not os.path.exists(path):
         print(f"[WARN] File not found: {path}")
         return None
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Read raw bytes - orjson parses them directly without a text decode step
+    with open(path, 'rb') as f:
+        return _parse_json_bytes(f.read())
+
+
+def _parse_json_bytes(raw):
+    """Parse UTF-8 JSON bytes with orjson when available, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json_files(paths):
+    """Load several JSON files concurrently, returning their data in the order of paths."""
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return list(executor.map(load_json, paths))
 
 
 def save_json(path, data):
-    """Save JSON data to a file."""
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Save JSON data to a file, replacing it atomically via a temp file."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Serialize up front so a failure never leaves a half-written file behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+# Patterns used by the name cleaning helpers below, compiled once
+_RE_CRAFT_PREFIX = re.compile(r'^\d+/\d+\s+')
+_RE_INVALID_CHARS = re.compile(r'[^a-z0-9-]')
+_RE_MULTI_HYPHEN = re.compile(r'-+')
+# Tier prefix dropped from normalized tool/building names ("tier-1-saw" -> "saw")
+_RE_TIER_PREFIX = re.compile(r'^tier-[1-3]-')
+# Tier label stripped from lowercased requirement text ("tier 1 saw" -> "saw")
+_RE_TIER_LABEL = re.compile(r'tier [1-3] ')
+# Tier label and number in lowercased tool/building requirements ("tier 2 saw" -> 2, "saw")
+_RE_TIER_NUMBER = re.compile(r'tier\s*(\d+)\s*')
+# Leading quality prefixes ignored when fuzzy matching item names
+_RE_FUZZY_PREFIX = re.compile(r'^(?:(?:Plain|Basic|Simple|Rough)\s+)+')
+
+# Drops apostrophes/backticks and turns spaces and underscores into hyphens
+_NAME_TRANSLATION = str.maketrans({"'": None, "`": None, ' ': '-', '_': '-'})
 
 
 def clean_craft_name(name):
     """Clean craft name by removing AI-generated prefixes like '1/2', '2/3', etc."""
     # Remove patterns like "1/2 ", "2/3 ", "1/4 " at the start of craft names
-    cleaned = re.sub(r'^\d+/\d+\s+', '', name.strip())
+    cleaned = _RE_CRAFT_PREFIX.sub('', name.strip())
     return cleaned
 
 
@@ -210,19 +296,17 @@ def convert_roman_to_arabic(text):
     return result
 
 
+@lru_cache(maxsize=8192)
 def normalize_name(name):
     """Normalize name to BitCrafty ID format: lowercase, hyphens, no spaces, no apostrophes."""
-    import re
     # Convert to lowercase first
     normalized = name.lower()
-    # Remove apostrophes and single quotes
-    normalized = normalized.replace("'", "").replace("'", "").replace("`", "")
-    # Replace spaces and underscores with hyphens
-    normalized = normalized.replace(' ', '-').replace('_', '-')
+    # Remove apostrophes and replace spaces and underscores with hyphens
+    normalized = normalized.translate(_NAME_TRANSLATION)
     # Remove any other invalid characters, keeping only letters, numbers, and hyphens
-    normalized = re.sub(r'[^a-z0-9-]', '', normalized)
+    normalized = _RE_INVALID_CHARS.sub('', normalized)
     # Remove multiple consecutive hyphens
-    normalized = re.sub(r'-+', '-', normalized)
+    normalized = _RE_MULTI_HYPHEN.sub('-', normalized)
     # Remove leading/trailing hyphens
     normalized = normalized.strip('-')
     return normalized
@@ -239,7 +323,10 @@ def extract_profession_from_crafts(crafts_export):
         return item_to_profession
     
     for craft in crafts_export['crafts']:
-        profession = craft.get('requirements', {}).get('profession')
+        requirements = craft.get('requirements')
+        if not requirements:
+            continue
+        profession = requirements.get('profession')
         if not profession:
             continue
         
@@ -252,11 +339,12 @@ def extract_profession_from_crafts(crafts_export):
             item_name = output.get('item')
             if item_name:
                 item_to_profession[item_name] = normalized_profession
-                print(f"[DEBUG] Mapped output item '{item_name}' to profession '{normalized_profession}'")
+                log.debug("Mapped output item '%s' to profession '%s'", item_name, normalized_profession)
     
     return item_to_profession
 
 
+@lru_cache(maxsize=8192)
 def transform_to_bitcrafty_id(entity_type, name, profession=None):
     """Transform entity to BitCrafty ID format: [entity-type]:[profession]:[identifier]"""
     normalized_name = normalize_name(name)
@@ -267,18 +355,36 @@ def transform_to_bitcrafty_id(entity_type, name, profession=None):
         return f"{entity_type}:{normalized_profession}:{normalized_name}"
     elif entity_type == 'tool':
         # Tools don't use profession, extract base name (e.g., "Tier 1 Saw" -> "tool:saw")
-        base_name = normalized_name.replace('tier-1-', '').replace('tier-2-', '').replace('tier-3-', '')
+        base_name = _RE_TIER_PREFIX.sub('', normalized_name, count=1)
         return f"tool:{base_name}"
     elif entity_type == 'building':
         # Buildings similar to tools
-        base_name = normalized_name.replace('tier-1-', '').replace('tier-2-', '').replace('tier-3-', '')
+        base_name = _RE_TIER_PREFIX.sub('', normalized_name, count=1)
         return f"building:{base_name}"
     else:
         return f"{entity_type}:{normalized_name}"
 
 
-def normalize_extractor_data(items_export, crafts_export):
-    """Normalize extractor data to BitCrafty format."""
+def _lookup_existing_item_id(item_name, item_index):
+    """Find an existing item ID by name, then by name without common prefixes.
+    item_index maps names and prefix-stripped aliases to (item_id, is_alias).
+    Returns (item_id, is_fuzzy_match); item_id is None when nothing matches.
+    """
+    match = item_index.get(item_name)
+    if match is not None:
+        return match
+    
+    match = item_index.get(_RE_FUZZY_PREFIX.sub('', item_name).strip())
+    if match is None:
+        return None, False
+    return match[0], True
+
+
+def normalize_extractor_data(items_export, crafts_export, bitcrafty_items_data=None):
+    """Normalize extractor data to BitCrafty format.
+
+    bitcrafty_items_data is the already loaded BitCrafty items file; it is read from disk when omitted.
+    """
     normalized_items = {}
     normalized_crafts = {}
     
@@ -289,25 +395,23 @@ def normalize_extractor_data(items_export, crafts_export):
     item_name_to_id = {}
     
     # Load existing BitCrafty items to check for name matches
-    existing_bitcrafty_items = load_json(ITEMS_DATA_PATH) or []
-    existing_item_names = {}
-    existing_item_fuzzy_names = {}  # For fuzzy matching
-    existing_items_by_id = {}  # For lookup by ID
-    for item in existing_bitcrafty_items:
-        name = item.get('name', '').strip()
-        item_id = item.get('id')
-        if name and item_id:
-            existing_item_names[name] = item_id
-            existing_items_by_id[item_id] = item  # Store full item data
-            
-            # Also create fuzzy matching entries
-            # Remove common prefixes for fuzzy matching
-            fuzzy_name = name
-            for prefix in ['Plain ', 'Basic ', 'Simple ', 'Rough ']:
-                fuzzy_name = fuzzy_name.replace(prefix, '').strip()
-            
-            if fuzzy_name != name:
-                existing_item_fuzzy_names[fuzzy_name] = item_id
+    if bitcrafty_items_data is None:
+        bitcrafty_items_data = load_json(ITEMS_DATA_PATH)
+    existing_bitcrafty_items = bitcrafty_items_data or []
+    named_items = [
+        (name, item_id, item) for item in existing_bitcrafty_items
+        if (name := item.get('name', '').strip()) and (item_id := item.get('id'))
+    ]
+    existing_items_by_id = {item_id: item for _, item_id, item in named_items}  # Full item data by ID
+    
+    # Exact names and prefix-stripped aliases share one index: name -> (item_id, is_alias).
+    # Aliases keep the first item that produced them (hence reversed) and are
+    # overwritten by any item that really has that name.
+    existing_item_index = {
+        fuzzy_name: (item_id, True) for name, item_id, _ in reversed(named_items)
+        if (fuzzy_name := _RE_FUZZY_PREFIX.sub('', name).strip()) != name
+    }
+    existing_item_index.update((name, (item_id, False)) for name, item_id, _ in named_items)
     
     # Normalize items - match BitCrafty format exactly
     if items_export and 'items' in items_export:
@@ -323,9 +427,9 @@ def normalize_extractor_data(items_export, crafts_export):
                 inferred_profession = infer_profession_from_item_name(name)
                 if inferred_profession:
                     profession = inferred_profession
-                    print(f"[INFO] Inferred profession '{profession}' for item: {name}")
+                    log.info("Inferred profession '%s' for item: %s", profession, name)
                 else:
-                    print(f"[WARN] No profession found for item: {name} - skipping")
+                    log.warning("No profession found for item: %s - skipping", name)
                     continue
                 
             bitcrafty_id = transform_to_bitcrafty_id('item', name, profession)
@@ -335,7 +439,8 @@ def normalize_extractor_data(items_export, crafts_export):
                 'name': name,
                 'description': item.get('description', ''),  # Include description from extractor exports
                 'tier': item.get('tier', 1),
-                'rank': item.get('rarity', 'Common').title()  # Use 'rank' not 'rarity', capitalize
+                # Use 'rank' not 'rarity', capitalize; interned as there are only a handful of ranks
+                'rank': sys.intern(item.get('rarity', 'Common').title())
             }
             item_name_to_id[name] = bitcrafty_id
     
@@ -343,7 +448,8 @@ def normalize_extractor_data(items_export, crafts_export):
     if crafts_export and 'crafts' in crafts_export:
         for craft in crafts_export['crafts']:
             name = craft.get('name')
-            profession = craft.get('requirements', {}).get('profession')
+            requirements = craft.get('requirements')
+            profession = requirements.get('profession') if requirements else None
             if not name or not profession:
                 continue
             
@@ -352,7 +458,7 @@ def normalize_extractor_data(items_export, crafts_export):
             
             # Clean the craft name of AI-generated prefixes
             cleaned_name = clean_craft_name(name)
-            print(f"[DEBUG] Craft name: '{name}' -> '{cleaned_name}', profession: '{profession}' -> '{normalized_profession}'")
+            log.debug("Craft name: '%s' -> '%s', profession: '%s' -> '%s'", name, cleaned_name, profession, normalized_profession)
                 
             bitcrafty_id = transform_to_bitcrafty_id('craft', cleaned_name, normalized_profession)
             
@@ -360,25 +466,17 @@ def normalize_extractor_data(items_export, crafts_export):
             materials = []
             for material in craft.get('materials', []):
                 item_name = material.get('item')
-                if item_name in item_name_to_id:
+                known_item_id = item_name_to_id.get(item_name)
+                if known_item_id is not None:
                     materials.append({
-                        'item': item_name_to_id[item_name],
+                        'item': known_item_id,
                         'qty': material.get('qty', 1)
                     })
                 else:
-                    # Check if this item already exists in BitCrafty first
-                    existing_item_id = existing_item_names.get(item_name)
-                    
-                    # If no exact match, try fuzzy matching
-                    if not existing_item_id:
-                        # Try without common prefixes
-                        fuzzy_name = item_name
-                        for prefix in ['Plain ', 'Basic ', 'Simple ', 'Rough ']:
-                            fuzzy_name = fuzzy_name.replace(prefix, '').strip()
-                        
-                        existing_item_id = existing_item_fuzzy_names.get(fuzzy_name)
-                        if existing_item_id:
-                            print(f"[INFO] Fuzzy match found for material '{item_name}' -> existing item with full name")
+                    # Check if this item already exists in BitCrafty first (exact, then fuzzy)
+                    existing_item_id, fuzzy_match = _lookup_existing_item_id(item_name, existing_item_index)
+                    if fuzzy_match:
+                        log.info("Fuzzy match found for material '%s' -> existing item with full name", item_name)
                     
                     if existing_item_id:
                         # For materials, we should prefer using existing items even if profession differs
@@ -388,7 +486,7 @@ def normalize_extractor_data(items_export, crafts_export):
                             'qty': material.get('qty', 1)
                         })
                         item_name_to_id[item_name] = existing_item_id
-                        print(f"[INFO] Using existing BitCrafty material: {item_name} -> {existing_item_id}")
+                        log.info("Using existing BitCrafty material: %s -> %s", item_name, existing_item_id)
                         
                         # Add existing BitCrafty item to normalized_items to prevent it from being flagged for update
                         if existing_item_id not in normalized_items and existing_item_id in existing_items_by_id:
@@ -412,7 +510,7 @@ def normalize_extractor_data(items_export, crafts_export):
                             fallback_profession = get_fallback_profession_for_material(item_name, normalized_profession)
                             normalized_fallback = normalize_name(fallback_profession)
                             item_id = transform_to_bitcrafty_id('item', item_name, normalized_fallback)
-                            print(f"[WARN] Using fallback profession '{normalized_fallback}' for material: {item_name}")
+                            log.warning("Using fallback profession '%s' for material: %s", normalized_fallback, item_name)
                         
                         materials.append({
                             'item': item_id,
@@ -428,31 +526,23 @@ def normalize_extractor_data(items_export, crafts_export):
                                 'rank': 'Common'
                             }
                             item_name_to_id[item_name] = item_id
-                            print(f"[INFO] Created missing material item: {item_id}")
+                            log.info("Created missing material item: %s", item_id)
             
             # Transform outputs to use item IDs (these should already be mapped)
             outputs = []
             for output in craft.get('outputs', []):
                 item_name = output.get('item')
-                if item_name in item_name_to_id:
+                known_item_id = item_name_to_id.get(item_name)
+                if known_item_id is not None:
                     outputs.append({
-                        'item': item_name_to_id[item_name],
+                        'item': known_item_id,
                         'qty': output.get('qty', 1)
                     })
                 else:
                     # Check if this item already exists in BitCrafty with a different profession
-                    existing_item_id = existing_item_names.get(item_name)
-                    
-                    # If no exact match, try fuzzy matching
-                    if not existing_item_id:
-                        # Try without common prefixes
-                        fuzzy_name = item_name
-                        for prefix in ['Plain ', 'Basic ', 'Simple ', 'Rough ']:
-                            fuzzy_name = fuzzy_name.replace(prefix, '').strip()
-                        
-                        existing_item_id = existing_item_fuzzy_names.get(fuzzy_name)
-                        if existing_item_id:
-                            print(f"[INFO] Fuzzy match found for '{item_name}' -> existing item with full name")
+                    existing_item_id, fuzzy_match = _lookup_existing_item_id(item_name, existing_item_index)
+                    if fuzzy_match:
+                        log.info("Fuzzy match found for '%s' -> existing item with full name", item_name)
                     
                     if existing_item_id:
                         # Validate if the existing item matches what this craft should produce
@@ -466,7 +556,7 @@ def normalize_extractor_data(items_export, crafts_export):
                                 'qty': output.get('qty', 1)
                             })
                             item_name_to_id[item_name] = existing_item_id
-                            print(f"[INFO] Using existing BitCrafty item: {item_name} -> {existing_item_id}")
+                            log.info("Using existing BitCrafty item: %s -> %s", item_name, existing_item_id)
                         else:
                             # Profession mismatch - this craft should create a new item with correct profession
                             correct_item_id = transform_to_bitcrafty_id('item', item_name, normalized_profession)
@@ -476,10 +566,14 @@ def normalize_extractor_data(items_export, crafts_export):
                             })
                             item_name_to_id[item_name] = correct_item_id
                             
-                            print(f"[WARN] Profession mismatch for '{item_name}':")
-                            print(f"  Existing: {existing_item_id} (profession: {existing_profession})")
-                            print(f"  Expected: {correct_item_id} (profession: {expected_profession})")
-                            print(f"  Creating new item with correct profession for craft output")
+                            log.warning(
+                                "Profession mismatch for '%s':\n"
+                                "  Existing: %s (profession: %s)\n"
+                                "  Expected: %s (profession: %s)\n"
+                                "  Creating new item with correct profession for craft output",
+                                item_name, existing_item_id, existing_profession,
+                                correct_item_id, expected_profession
+                            )
                             
                             # Create the new item entry with correct profession
                             if correct_item_id not in normalized_items:
@@ -490,7 +584,7 @@ def normalize_extractor_data(items_export, crafts_export):
                                     'tier': 1,
                                     'rank': 'Common'
                                 }
-                                print(f"[INFO] Created new output item with correct profession: {correct_item_id}")
+                                log.info("Created new output item with correct profession: %s", correct_item_id)
                     else:
                         # No existing item found - create new one with craft's profession
                         item_id = transform_to_bitcrafty_id('item', item_name, normalized_profession)
@@ -508,7 +602,7 @@ def normalize_extractor_data(items_export, crafts_export):
                                 'rank': 'Common'
                             }
                             item_name_to_id[item_name] = item_id
-                            print(f"[INFO] Created missing output item: {item_id}")
+                            log.info("Created missing output item: %s", item_id)
             
             # Match BitCrafty crafts.json format exactly
             normalized_crafts[bitcrafty_id] = {
@@ -516,31 +610,42 @@ def normalize_extractor_data(items_export, crafts_export):
                 'name': cleaned_name,
                 'materials': materials,
                 'outputs': outputs,
-                'requirements': craft.get('requirements', {})  # Keep for now, will be replaced with requirement ID
+                'requirements': requirements  # Keep for now, will be replaced with requirement ID
             }
     
     return normalized_items, normalized_crafts
 
 
+# Common name patterns for different professions, in priority order
+_PROFESSION_KEYWORDS = (
+    ('carpentry', ('wood', 'log', 'trunk', 'stripped', 'plank')),
+    ('tailoring', ('thread', 'spool', 'cloth', 'fabric')),
+    ('foraging', ('mushroom', 'berry', 'fruit', 'vegetable')),
+    # Pottery items (pots) are often made from clay, so mining
+    ('mining', ('clay', 'stone', 'ore', 'metal', 'pot', 'brick', 'glass')),
+    ('forestry', ('sap', 'resin')),
+    ('farming', ('seed', 'fertilizer', 'grain')),
+)
+_PROFESSION_PRIORITY = {profession: rank for rank, (profession, _) in enumerate(_PROFESSION_KEYWORDS)}
+
+
+# Keywords match anywhere in the name, like the original substring checks ("Teapot",
+# "Sapling"). The zero-width lookahead tries every position so overlapping keywords
+# are all seen; at a shared position the higher priority profession is tried first.
+_RE_PROFESSION_KEYWORD = re.compile('(?=(?:' + '|'.join(
+    f"(?P<{profession}>{'|'.join(words)})"
+    for profession, words in _PROFESSION_KEYWORDS
+) + '))')
+
+
+@lru_cache(maxsize=8192)
 def infer_profession_from_item_name(item_name):
     """Infer profession from item name based on common patterns."""
-    name_lower = item_name.lower()
-    
-    # Common patterns for different professions
-    if any(word in name_lower for word in ['wood', 'log', 'trunk', 'stripped', 'plank']):
-        return 'carpentry'
-    elif any(word in name_lower for word in ['thread', 'spool', 'cloth', 'fabric']):
-        return 'tailoring'  
-    elif any(word in name_lower for word in ['mushroom', 'berry', 'fruit', 'vegetable']):
-        return 'foraging'
-    elif any(word in name_lower for word in ['clay', 'stone', 'ore', 'metal', 'pot', 'brick', 'glass']):
-        return 'mining'  # Pottery items (pots) are often made from clay, so mining
-    elif any(word in name_lower for word in ['sap', 'resin']):
-        return 'forestry'
-    elif any(word in name_lower for word in ['seed', 'fertilizer', 'grain']):
-        return 'farming'
-    
-    return None
+    # One scan collects every matching profession; the highest priority one wins
+    found = {match.lastgroup for match in _RE_PROFESSION_KEYWORD.finditer(item_name.lower())}
+    if not found:
+        return None
+    return min(found, key=_PROFESSION_PRIORITY.__getitem__)
 
 
 def get_fallback_profession_for_material(item_name, current_craft_profession):
@@ -584,12 +689,9 @@ def load_bitcrafty_data(items_data, crafts_data):
 def resolve_craft_name_conflicts(normalized_crafts):
     """Resolve craft name conflicts by adding input materials to ID and name."""
     # Group crafts by base name
-    name_groups = {}
+    name_groups = defaultdict(list)
     for craft_id, craft in normalized_crafts.items():
-        base_name = craft['name']
-        if base_name not in name_groups:
-            name_groups[base_name] = []
-        name_groups[base_name].append((craft_id, craft))
+        name_groups[craft['name']].append((craft_id, craft))
     
     # Update crafts with conflicts
     updated_crafts = {}
@@ -600,7 +702,7 @@ def resolve_craft_name_conflicts(normalized_crafts):
             updated_crafts[craft_id] = craft
         else:
             # Multiple crafts with same name, differentiate by main input
-            print(f"[INFO] Resolving {len(craft_list)} craft name conflicts for: {base_name}")
+            log.info("Resolving %d craft name conflicts for: %s", len(craft_list), base_name)
             for craft_id, craft in craft_list:
                 # Get main input material for differentiation
                 main_input = ""
@@ -619,12 +721,11 @@ def resolve_craft_name_conflicts(normalized_crafts):
                     craft['name'] = new_name
                     updated_crafts[new_id] = craft
                     
-                    print(f"  Updated: {craft_id} -> {new_id}")
-                    print(f"    Name: {base_name} -> {new_name}")
+                    log.info("Updated: %s -> %s\n  Name: %s -> %s", craft_id, new_id, base_name, new_name)
                 else:
                     # Fallback: keep original if no main input found
                     updated_crafts[craft_id] = craft
-                    print(f"  [WARN] No main input found for: {craft_id}")
+                    log.warning("No main input found for: %s", craft_id)
     
     return updated_crafts
 
@@ -663,6 +764,33 @@ def find_items_needing_descriptions(bitcrafty_items, items_export):
     return items_needing_descriptions
 
 
+def _craft_signature(craft):
+    """Hashable summary of a craft's requirement plus the (item, qty) pairs of its materials and outputs, in order.
+
+    Both the requirement ID and any inline requirements are included, so crafts that differ only in
+    their requirements never look identical.
+    """
+    return (
+        craft.get('requirement'),
+        tuple(sorted((craft.get('requirements') or {}).items())),
+        tuple((m.get('item'), m.get('qty', 1)) for m in craft.get('materials', [])),
+        tuple((o.get('item'), o.get('qty', 1)) for o in craft.get('outputs', []))
+    )
+
+
+@lru_cache(maxsize=None)
+def create_export_manager():
+    """Create an ExportManager for intelligent craft merging.
+    The extractor package (and its structlog dependency) is only imported on first use, and the
+    manager (which loads the existing exports from disk) is built once and reused.
+    """
+    src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+    if src_dir not in sys.path:
+        sys.path.append(src_dir)
+    from bitcrafty_extractor.export.export_manager import ExportManager
+    return ExportManager()
+
+
 def intelligent_craft_comparison(normalized_craft, existing_craft, export_manager):
     """Use ExportManager's intelligent logic to determine if craft should be updated.
     
@@ -675,6 +803,10 @@ def intelligent_craft_comparison(normalized_craft, existing_craft, export_manage
         tuple: (should_update: bool, reason: str)
     """
     try:
+        # Identical recipes with the same requirements need no update - skip the ExportManager round trip
+        if _craft_signature(normalized_craft) == _craft_signature(existing_craft):
+            return False, "Identical materials and outputs"
+        
         # Convert BitCrafty format back to extractor format for comparison
         extractor_format_existing = {
             'name': existing_craft.get('name', ''),
@@ -725,6 +857,14 @@ def intelligent_craft_comparison(normalized_craft, existing_craft, export_manage
         return False, f"Error in intelligent comparison: {e}"
 
 
+# BitCrafty crafts only reference a requirement ID, so the merge sees these placeholders for the existing side
+_MERGE_PLACEHOLDER_REQUIREMENTS = MappingProxyType({
+    'profession': 'unknown',
+    'building': 'unknown',
+    'tool': 'unknown'
+})
+
+
 def intelligent_craft_merge(existing_craft, new_craft, export_manager):
     """Use ExportManager's intelligent merging to create updated craft.
     
@@ -742,11 +882,7 @@ def intelligent_craft_merge(existing_craft, new_craft, export_manager):
             'name': existing_craft.get('name', ''),
             'materials': existing_craft.get('materials', []),
             'outputs': existing_craft.get('outputs', []),
-            'requirements': {
-                'profession': 'unknown',
-                'building': 'unknown', 
-                'tool': 'unknown'
-            },
+            'requirements': _MERGE_PLACEHOLDER_REQUIREMENTS,
             'confidence': 0.95,
             'id': existing_craft.get('id', '')
         }
@@ -771,6 +907,98 @@ def intelligent_craft_merge(existing_craft, new_craft, export_manager):
         return clean_craft_for_bitcrafty(new_craft)
 
 
+# Item fields diffed once an item is matched to BitCrafty by name (the name already agrees) or by ID
+_ITEM_DETAIL_FIELDS = ('description', 'tier', 'rank')
+_ITEM_ALL_FIELDS = ('name',) + _ITEM_DETAIL_FIELDS
+
+
+def _item_fields(item, fields):
+    """Values of the given fields (None where missing), fetched through a C-level map over dict.get."""
+    return tuple(map(item.get, fields))
+
+
+def compare_craft(craft_id, craft, bitcrafty_crafts, export_manager=None):
+    """Compare one normalized craft with BitCrafty, returning (bucket, entry) for changes['crafts']."""
+    existing = bitcrafty_crafts.get(craft_id)
+    if existing is None:
+        return 'new', craft
+
+    if export_manager:
+        # Use intelligent comparison
+        should_update, reason = intelligent_craft_comparison(craft, existing, export_manager)
+        if should_update:
+            log.info("Craft update needed: %s - %s", craft_id, reason)
+            return 'updated', {
+                'existing': existing,
+                'new': craft,
+                'changes': [reason]
+            }
+        log.debug("Craft unchanged: %s - %s", craft_id, reason)
+        return 'identical', craft
+
+    if craft is existing:
+        return 'identical', craft
+
+    # Intelligent craft comparison instead of simple field comparison
+    needs_update = False
+
+    # Compare name (case-insensitive, trimmed), materials and outputs
+    # (sorted by item so ordering differences don't count) in one tuple compare
+    new_fields = (
+        craft.get('name', '').strip().lower(),
+        sorted(craft.get('materials', []), key=lambda x: x.get('item', '')),
+        sorted(craft.get('outputs', []), key=lambda x: x.get('item', '')),
+    )
+    old_fields = (
+        existing.get('name', '').strip().lower(),
+        sorted(existing.get('materials', []), key=lambda x: x.get('item', '')),
+        sorted(existing.get('outputs', []), key=lambda x: x.get('item', '')),
+    )
+    if new_fields != old_fields:
+        needs_update = True
+
+    # Compare requirements - be smart about requirement references
+    craft_req = craft.get('requirement', '').strip()
+    existing_req = existing.get('requirement', '').strip()
+    if craft_req != existing_req:
+        # Only flag as needing update if both are non-empty and different
+        # If one is empty and the other isn't, it might be an addition, not an update
+        if craft_req and existing_req:
+            needs_update = True
+        elif not craft_req and existing_req:
+            # Extracted craft is missing requirement that exists - leave existing
+            pass
+        elif craft_req and not existing_req:
+            # New requirement being added - this is an update
+            needs_update = True
+
+    if needs_update:
+        return 'updated', {
+            'existing': existing,
+            'new': craft,
+            'changes': ['Intelligent field comparison']
+        }
+    return 'identical', craft
+
+
+def recompare_crafts(changes, craft_ids, normalized_crafts, bitcrafty_crafts):
+    """Re-run the craft comparison for just the given crafts, updating changes in place."""
+    craft_changes = changes['crafts']
+    moved = False
+    for craft_id in craft_ids:
+        bucket, entry = compare_craft(craft_id, normalized_crafts[craft_id], bitcrafty_crafts)
+        for other_bucket, entries in craft_changes.items():
+            if other_bucket != bucket and entries.pop(craft_id, None) is not None:
+                moved = True
+        craft_changes[bucket][craft_id] = entry
+
+    if moved:
+        # Keep each bucket in craft order, as a full compare_entities run would
+        for bucket, entries in craft_changes.items():
+            craft_changes[bucket] = {craft_id: entries[craft_id] for craft_id in normalized_crafts if craft_id in entries}
+    return changes
+
+
 def compare_entities(normalized_items, normalized_crafts, bitcrafty_items, bitcrafty_crafts):
     """Compare normalized extractor data with BitCrafty data using intelligent logic."""
     
@@ -795,19 +1023,20 @@ def compare_entities(normalized_items, normalized_crafts, bitcrafty_items, bitcr
     }
     
     # Create name-to-item mapping for BitCrafty items
-    bitcrafty_by_name = {}
-    for item_id, item in bitcrafty_items.items():
-        name = item.get('name', '').strip()
-        if name:
-            bitcrafty_by_name[name] = (item_id, item)
+    bitcrafty_by_name = {
+        name: (item_id, item)
+        for item_id, item in bitcrafty_items.items()
+        if (name := item.get('name', '').strip())
+    }
     
     # Compare items by name first, then by ID
     for item_id, item in normalized_items.items():
         item_name = item.get('name', '').strip()
         
         # Check if an item with this name already exists in BitCrafty
-        if item_name in bitcrafty_by_name:
-            existing_id, existing_item = bitcrafty_by_name[item_name]
+        name_match = bitcrafty_by_name.get(item_name)
+        if name_match is not None:
+            existing_id, existing_item = name_match
             
             if existing_id != item_id:
                 # Same name, different ID - need to update BitCrafty to use our ID
@@ -818,12 +1047,13 @@ def compare_entities(normalized_items, normalized_crafts, bitcrafty_items, bitcr
                     'new': item,
                     'reason': f"Name match: '{item_name}'"
                 }
-                print(f"[INFO] ID update needed: {existing_id} -> {item_id} (name: {item_name})")
+                log.info("ID update needed: %s -> %s (name: %s)", existing_id, item_id, item_name)
             else:
-                # Same name and ID - check for other differences
-                if (item.get('description') != existing_item.get('description') or 
-                    item.get('tier') != existing_item.get('tier') or
-                    item.get('rank') != existing_item.get('rank')):
+                # Same name and ID - the same dict is trivially identical, otherwise check for other differences
+                if item is existing_item:
+                    changes['items']['identical'][item_id] = item
+                    continue
+                if _item_fields(item, _ITEM_DETAIL_FIELDS) != _item_fields(existing_item, _ITEM_DETAIL_FIELDS):
                     changes['items']['updated'][item_id] = {
                         'existing': existing_item,
                         'new': item,
@@ -833,12 +1063,12 @@ def compare_entities(normalized_items, normalized_crafts, bitcrafty_items, bitcr
                     changes['items']['identical'][item_id] = item
         else:
             # Check by ID if not found by name
-            if item_id in bitcrafty_items:
-                existing = bitcrafty_items[item_id]
-                if (item.get('name') != existing.get('name') or 
-                    item.get('description') != existing.get('description') or
-                    item.get('tier') != existing.get('tier') or
-                    item.get('rank') != existing.get('rank')):
+            existing = bitcrafty_items.get(item_id)
+            if existing is not None:
+                if item is existing:
+                    changes['items']['identical'][item_id] = item
+                    continue
+                if _item_fields(item, _ITEM_ALL_FIELDS) != _item_fields(existing, _ITEM_ALL_FIELDS):
                     changes['items']['updated'][item_id] = {
                         'existing': existing,
                         'new': item,
@@ -848,153 +1078,103 @@ def compare_entities(normalized_items, normalized_crafts, bitcrafty_items, bitcr
                     changes['items']['identical'][item_id] = item
             else:
                 # Completely new item
-                changes['items']['new'][item_id] = item        # Compare crafts using intelligent logic
-        for craft_id, craft in normalized_crafts.items():
-            if craft_id in bitcrafty_crafts:
-                existing = bitcrafty_crafts[craft_id]
-                
-                if export_manager:
-                    # Use intelligent comparison
-                    should_update, reason = intelligent_craft_comparison(craft, existing, export_manager)
-                    if should_update:
-                        changes['crafts']['updated'][craft_id] = {
-                            'existing': existing,
-                            'new': craft,
-                            'changes': [reason]
-                        }
-                        print(f"[INFO] Craft update needed: {craft_id} - {reason}")
-                    else:
-                        changes['crafts']['identical'][craft_id] = craft
-                        print(f"[DEBUG] Craft unchanged: {craft_id} - {reason}")
-                else:
-                    # Intelligent craft comparison instead of simple field comparison
-                    needs_update = False
-                    
-                    # Compare name (case-insensitive, trimmed)
-                    if craft.get('name', '').strip().lower() != existing.get('name', '').strip().lower():
-                        needs_update = True
-                        
-                    # Compare materials (normalize and sort for comparison)
-                    craft_materials = sorted(craft.get('materials', []), key=lambda x: x.get('item', ''))
-                    existing_materials = sorted(existing.get('materials', []), key=lambda x: x.get('item', ''))
-                    if craft_materials != existing_materials:
-                        needs_update = True
-                        
-                    # Compare outputs (normalize and sort for comparison)
-                    craft_outputs = sorted(craft.get('outputs', []), key=lambda x: x.get('item', ''))
-                    existing_outputs = sorted(existing.get('outputs', []), key=lambda x: x.get('item', ''))
-                    if craft_outputs != existing_outputs:
-                        needs_update = True
-                        
-                    # Compare requirements - be smart about requirement references
-                    craft_req = craft.get('requirement', '').strip()
-                    existing_req = existing.get('requirement', '').strip()
-                    if craft_req != existing_req:
-                        # Only flag as needing update if both are non-empty and different
-                        # If one is empty and the other isn't, it might be an addition, not an update
-                        if craft_req and existing_req:
-                            needs_update = True
-                        elif not craft_req and existing_req:
-                            # Extracted craft is missing requirement that exists - leave existing
-                            pass
-                        elif craft_req and not existing_req:
-                            # New requirement being added - this is an update
-                            needs_update = True
-                    
-                    if needs_update:
-                        changes['crafts']['updated'][craft_id] = {
-                            'existing': existing,
-                            'new': craft,
-                            'changes': ['Intelligent field comparison']
-                        }
-                    else:
-                        changes['crafts']['identical'][craft_id] = craft
-            else:
-                changes['crafts']['new'][craft_id] = craft
+                changes['items']['new'][item_id] = item
+
+    # Compare crafts using intelligent logic
+    for craft_id, craft in normalized_crafts.items():
+        bucket, entry = compare_craft(craft_id, craft, bitcrafty_crafts, export_manager)
+        changes['crafts'][bucket][craft_id] = entry
     
     return changes
 
 
-def update_craft_item_references(normalized_crafts, id_updates):
-    """Update craft item references to use updated item IDs."""
-    old_to_new_id = {}
-    for old_id, update_info in id_updates.items():
-        old_to_new_id[old_id] = update_info['new_id']
-    
+def _remap_item_refs(entries, old_to_new_id, kind, craft_id):
+    """Return a copy of a material/output list with item IDs remapped, or None if nothing changed.
+
+    Only the entries whose item changes are copied; the rest are shared with the original list.
+    """
+    remapped = None
+    for index, entry in enumerate(entries):
+        old_ref = entry.get('item', '')
+        new_ref = old_to_new_id.get(old_ref)
+        if new_ref is None:
+            continue
+        if remapped is None:
+            remapped = list(entries)
+        remapped[index] = {**entry, 'item': new_ref}
+        log.info("Updated craft %s: %s -> %s in %s", kind, old_ref, new_ref, craft_id)
+    return remapped
+
+
+def update_craft_item_references(normalized_crafts, old_to_new_id):
+    """Update craft item references to use updated item IDs.
+
+    old_to_new_id maps each old item ID to its replacement. Returns (updated_crafts, touched_craft_ids)
+    so callers can re-compare only the crafts that changed.
+    """
     updated_crafts = {}
+    touched_craft_ids = set()
     for craft_id, craft in normalized_crafts.items():
-        updated_craft = deepcopy(craft)
+        remapped = {}
         
         # Update materials (BitCrafty uses 'materials' not 'inputs')
-        if 'materials' in updated_craft:
-            for material in updated_craft['materials']:
-                item_ref = material.get('item', '')
-                if item_ref in old_to_new_id:
-                    old_ref = item_ref
-                    new_ref = old_to_new_id[item_ref]
-                    material['item'] = new_ref
-                    print(f"[INFO] Updated craft material: {old_ref} -> {new_ref} in {craft_id}")
+        if 'materials' in craft:
+            materials = _remap_item_refs(craft['materials'], old_to_new_id, 'material', craft_id)
+            if materials is not None:
+                remapped['materials'] = materials
         
         # Update outputs
-        if 'outputs' in updated_craft:
-            for output in updated_craft['outputs']:
-                item_ref = output.get('item', '')
-                if item_ref in old_to_new_id:
-                    old_ref = item_ref
-                    new_ref = old_to_new_id[item_ref]
-                    output['item'] = new_ref
-                    print(f"[INFO] Updated craft output: {old_ref} -> {new_ref} in {craft_id}")
-        
-        updated_crafts[craft_id] = updated_craft
+        if 'outputs' in craft:
+            outputs = _remap_item_refs(craft['outputs'], old_to_new_id, 'output', craft_id)
+            if outputs is not None:
+                remapped['outputs'] = outputs
+        
+        # Untouched crafts are passed through as-is rather than deep-copied
+        if remapped:
+            touched_craft_ids.add(craft_id)
+            updated_crafts[craft_id] = {**craft, **remapped}
+        else:
+            updated_crafts[craft_id] = craft
     
-    return updated_crafts
+    return updated_crafts, touched_craft_ids
+
+
+# Building types that stand in for any building whose name contains them, checked in order
+_GENERIC_BUILDING_TYPES = ('station', 'kiln', 'well', 'loom')
+
+
+@lru_cache(maxsize=1024)
+def _clean_requirement_name(name):
+    """Lowercase a tool/building name with Roman numerals converted and "tier N" labels removed."""
+    return _RE_TIER_LABEL.sub('', convert_roman_to_arabic(name).lower())
+
+
+@lru_cache(maxsize=1024)
+def _building_type(building):
+    """Building type for metadata ("carpentry station" -> "station"), or the whole cleaned name."""
+    clean_building = _clean_requirement_name(building)
+    return next((kind for kind in _GENERIC_BUILDING_TYPES if kind in clean_building), clean_building)
+
+
+def _craft_metadata(craft):
+    """(profession, tool, building) named by one craft's requirements, with None for anything missing."""
+    requirements = craft.get('requirements', {})
+    profession = requirements.get('profession')
+    tool = requirements.get('tool')
+    building = requirements.get('building')
+    return (
+        normalize_name(profession) if profession else None,
+        _clean_requirement_name(tool) if tool and tool != 'null' else None,
+        _building_type(building) if building and building != 'null' else None,
+    )
 
 
 def extract_metadata_from_crafts(normalized_crafts):
     """Extract tools, buildings, and professions from normalized crafts."""
-    professions = set()
-    tools = set()
-    buildings = set()
-    
-    for craft_id, craft in normalized_crafts.items():
-        requirements = craft.get('requirements', {})
-        
-        # Extract profession and normalize it
-        profession = requirements.get('profession')
-        if profession:
-            normalized_profession = normalize_name(profession)
-            professions.add(normalized_profession)
-        
-        # Extract tool
-        tool = requirements.get('tool')
-        if tool and tool != 'null' and tool is not None:
-            # Convert Roman numerals to Arabic before cleaning
-            tool_normalized = convert_roman_to_arabic(tool)
-            # Clean tool name (remove "Tier 1", etc.)
-            clean_tool = tool_normalized.lower().replace('tier 1 ', '').replace('tier 2 ', '').replace('tier 3 ', '')
-            tools.add(clean_tool)
-        
-        # Extract building
-        building = requirements.get('building')
-        if building and building != 'null' and building is not None:
-            # Convert Roman numerals to Arabic before cleaning
-            building_normalized = convert_roman_to_arabic(building)
-            # Clean building name and extract the actual building name
-            clean_building = building_normalized.lower().replace('tier 1 ', '').replace('tier 2 ', '').replace('tier 3 ', '')
-            
-            # Extract building type (e.g., "carpentry station" -> "station", "kiln" -> "kiln")
-            if 'station' in clean_building:
-                buildings.add('station')  # Generic station
-            elif 'kiln' in clean_building:
-                buildings.add('kiln')
-            elif 'well' in clean_building:
-                buildings.add('well')
-            elif 'loom' in clean_building:
-                buildings.add('loom')
-            else:
-                # Use the whole building name if no special handling
-                buildings.add(clean_building)
-    
+    rows = [_craft_metadata(craft) for craft in normalized_crafts.values()]
+    professions = {profession for profession, _, _ in rows if profession is not None}
+    tools = {tool for _, tool, _ in rows if tool is not None}
+    buildings = {building for _, _, building in rows if building is not None}
     return professions, tools, buildings
 
 
@@ -1008,43 +1188,39 @@ def compare_metadata(extracted_professions, extracted_tools, extracted_buildings
         'buildings': {'new': [], 'existing': []}
     }
     
-    # Compare professions
-    existing_professions = set()
-    if professions_meta:
-        for prof in professions_meta:
-            prof_name = prof.get('name', '')
-            if prof_name:
-                # Use normalize_name for consistency
-                existing_professions.add(normalize_name(prof_name))
+    # Compare professions (use normalize_name for consistency)
+    existing_professions = frozenset(
+        normalize_name(prof_name) for prof in professions_meta or () if (prof_name := prof.get('name', ''))
+    )
 
     for profession in extracted_professions:
         normalized_profession = normalize_name(profession)
         if normalized_profession in existing_professions:
             metadata_changes['professions']['existing'].append(profession)
-            print(f"[DEBUG] Profession already exists: {profession}")
+            log.debug("Profession already exists: %s", profession)
         else:
             metadata_changes['professions']['new'].append(profession)
-            print(f"[INFO] New profession found: {profession}")
+            log.info("New profession found: %s", profession)
 
     # Compare tools
-    existing_tools = set()
-    if tools_meta:
-        for tool in tools_meta:
-            existing_tools.add(tool.get('name', '').lower())
+    existing_tools = frozenset(tool.get('name', '').lower() for tool in tools_meta or ())
 
     for tool in extracted_tools:
         if tool.lower() in existing_tools:
             metadata_changes['tools']['existing'].append(tool)
-            print(f"[DEBUG] Tool already exists: {tool}")
+            log.debug("Tool already exists: %s", tool)
         else:
             metadata_changes['tools']['new'].append(tool)
-            print(f"[INFO] New tool found: {tool}")
+            log.info("New tool found: %s", tool)
 
     # Compare buildings - check by building type and profession context
     existing_building_ids = set()
     if buildings_meta:
         for building in buildings_meta:
             existing_building_ids.add(building.get('id', ''))
+    # Lowercase the IDs once rather than per extracted building
+    existing_building_ids_lower = [bid.lower() for bid in existing_building_ids]
+    kiln_exists = any('kiln' in bid for bid in existing_building_ids_lower)
 
     for building in extracted_buildings:
         building_exists = False
@@ -1055,18 +1231,18 @@ def compare_metadata(extracted_professions, extracted_tools, extracted_buildings
             building_exists = False  # Will be checked per profession later
         elif building == 'kiln':
             # Check if any kiln exists (regardless of profession)
-            kiln_exists = any('kiln' in bid for bid in existing_building_ids)
             building_exists = kiln_exists
         else:
             # For other buildings, check generically
-            building_exists = any(building.lower() in bid.lower() for bid in existing_building_ids)
+            building_lower = building.lower()
+            building_exists = any(building_lower in bid for bid in existing_building_ids_lower)
         
         if building_exists:
             metadata_changes['buildings']['existing'].append(building)
-            print(f"[DEBUG] Building already exists: {building}")
+            log.debug("Building already exists: %s", building)
         else:
             metadata_changes['buildings']['new'].append(building)
-            print(f"[INFO] New building found: {building}")
+            log.info("New building found: %s", building)
     
     return metadata_changes
 
@@ -1126,18 +1302,19 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
     
     if items['new']:
         print(f"\n  {Colors.colorize('New items:', Colors.GREEN)}")
-        for item_id, item in list(items['new'].items())[:5]:  # Show first 5
-            print(f"    {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(item_id)}: {item.get('name')}")
+        for item_id, item in islice(items['new'].items(), 5):  # Show first 5
+            print(f"    {Colors.PLUS} {Colors.highlight(item_id)}: {item.get('name')}")
         if len(items['new']) > 5:
             remaining = len(items['new']) - 5
             print(f"    {Colors.gray(f'... and {remaining} more')}")
     
     if items.get('description_updates'):
         print(f"\n  {Colors.colorize('Items needing description updates:', Colors.CYAN)}")
-        for item_id, update_info in list(items['description_updates'].items())[:5]:  # Show first 5
+        for item_id, update_info in islice(items['description_updates'].items(), 5):  # Show first 5
             item_name = update_info['existing']['name']
-            description_preview = update_info['description'][:50] + ('...' if len(update_info['description']) > 50 else '')
-            print(f"    {Colors.colorize('📝', Colors.CYAN)} {Colors.highlight(item_id)}: {item_name}")
+            description = update_info['description']
+            description_preview = description[:50] + ('...' if len(description) > 50 else '')
+            print(f"    {Colors.NOTE} {Colors.highlight(item_id)}: {item_name}")
             print(f"      {Colors.gray(f'Description: {description_preview}')}")
         if len(items['description_updates']) > 5:
             remaining = len(items['description_updates']) - 5
@@ -1145,9 +1322,9 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
     
     if items['id_updates']:
         print(f"\n  {Colors.colorize('Items needing ID updates:', Colors.YELLOW)}")
-        for old_id, update_info in list(items['id_updates'].items())[:5]:
+        for old_id, update_info in islice(items['id_updates'].items(), 5):
             print(f"    {Colors.colorize('~', Colors.YELLOW)} {Colors.highlight(old_id)} → {Colors.highlight(update_info['new_id'])}")
-            print(f"      {Colors.gray(f'Reason: {update_info['reason']}')}")
+            print(f"      {Colors.gray('Reason: ' + update_info['reason'])}")
         if len(items['id_updates']) > 5:
             remaining = len(items['id_updates']) - 5
             print(f"    {Colors.gray(f'... and {remaining} more')}")
@@ -1161,8 +1338,8 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
     
     if crafts['new']:
         print(f"\n  {Colors.colorize('New crafts:', Colors.GREEN)}")
-        for craft_id, craft in list(crafts['new'].items())[:5]:  # Show first 5
-            print(f"    {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(craft_id)}: {craft.get('name')}")
+        for craft_id, craft in islice(crafts['new'].items(), 5):  # Show first 5
+            print(f"    {Colors.PLUS} {Colors.highlight(craft_id)}: {craft.get('name')}")
         if len(crafts['new']) > 5:
             remaining = len(crafts['new']) - 5
             print(f"    {Colors.gray(f'... and {remaining} more')}")
@@ -1176,9 +1353,9 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
         
         if requirement_changes['new']:
             print(f"\n  {Colors.colorize('New requirements:', Colors.GREEN)}")
-            for req_id, req_data in list(requirement_changes['new'].items())[:5]:
+            for req_id, req_data in islice(requirement_changes['new'].items(), 5):
                 craft_count = len(req_data['crafts'])
-                print(f"    {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(req_id)}: {req_data['entry']['name']} {Colors.gray(f'(used by {craft_count} crafts)')}")
+                print(f"    {Colors.PLUS} {Colors.highlight(req_id)}: {req_data['entry']['name']} {Colors.gray(f'(used by {craft_count} crafts)')}")
             if len(requirement_changes['new']) > 5:
                 remaining = len(requirement_changes['new']) - 5
                 print(f"    {Colors.gray(f'... and {remaining} more')}")
@@ -1194,7 +1371,7 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
         if new_metadata['professions']:
             print(f"    {Colors.colorize('New professions (white color):', Colors.GREEN)}")
             for prof in new_metadata['professions']:
-                print(f"      {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(prof['name'])}")
+                print(f"      {Colors.PLUS} {Colors.highlight(prof['name'])}")
         
         # Tools
         new_tools = len(new_metadata['tools'])
@@ -1203,7 +1380,7 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
         if new_metadata['tools']:
             print(f"    {Colors.colorize('New tools:', Colors.GREEN)}")
             for tool in new_metadata['tools']:
-                print(f"      {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(tool['id'])}: {tool['name']}")
+                print(f"      {Colors.PLUS} {Colors.highlight(tool['id'])}: {tool['name']}")
         
         # Buildings
         new_buildings = len(new_metadata['buildings'])
@@ -1212,7 +1389,7 @@ def print_comparison_summary(changes, metadata_changes=None, new_metadata=None,
         if new_metadata['buildings']:
             print(f"    {Colors.colorize('New buildings:', Colors.GREEN)}")
             for building in new_metadata['buildings']:
-                print(f"      {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(building['id'])}: {building['name']}")
+                print(f"      {Colors.PLUS} {Colors.highlight(building['id'])}: {building['name']}")
 
 
 def check_building_requirements_exist(extracted_requirements, buildings_meta):
@@ -1230,9 +1407,9 @@ def check_building_requirements_exist(extracted_requirements, buildings_meta):
         
         if building_ref and building_ref not in existing_building_ids:
             missing_buildings.append(building_ref)
-            print(f"[INFO] Missing building: {building_ref}")
+            log.info("Missing building: %s", building_ref)
         else:
-            print(f"[DEBUG] Building exists: {building_ref}")
+            log.debug("Building exists: %s", building_ref)
     
     return missing_buildings
 
@@ -1240,25 +1417,22 @@ def check_building_requirements_exist(extracted_requirements, buildings_meta):
 def main():
     # Load all relevant data
     print_info("Loading extractor exports and BitCrafty data...")
-    items_export = load_json(ITEMS_EXPORT_PATH)
-    crafts_export = load_json(CRAFTS_EXPORT_PATH)
-    items_data = load_json(ITEMS_DATA_PATH)
-    crafts_data = load_json(CRAFTS_DATA_PATH)
-    requirements_data = load_json(REQUIREMENTS_DATA_PATH)
-    professions_meta = load_json(PROFESSIONS_META_PATH)
-    tools_meta = load_json(TOOLS_META_PATH)
-    buildings_meta = load_json(BUILDINGS_META_PATH)
+    (items_export, crafts_export, items_data, crafts_data, requirements_data,
+     professions_meta, tools_meta, buildings_meta) = load_json_files([
+        ITEMS_EXPORT_PATH, CRAFTS_EXPORT_PATH, ITEMS_DATA_PATH, CRAFTS_DATA_PATH,
+        REQUIREMENTS_DATA_PATH, PROFESSIONS_META_PATH, TOOLS_META_PATH, BUILDINGS_META_PATH,
+    ])
 
     print_success("Data loaded. Ready for normalization and comparison.")
     
     # Step 2: Transform & Normalize extractor data
     print_info("Normalizing extractor data to BitCrafty format...")
-    normalized_items, normalized_crafts = normalize_extractor_data(items_export, crafts_export)
+    normalized_items, normalized_crafts = normalize_extractor_data(items_export, crafts_export, items_data)
     
     print_success(f"Normalized {Colors.bold(str(len(normalized_items)))} items and {Colors.bold(str(len(normalized_crafts)))} crafts")
-    for item_id in list(normalized_items.keys())[:3]:  # Show first 3 as examples
+    for item_id in islice(normalized_items, 3):  # Show first 3 as examples
         print(f"  Item: {Colors.highlight(item_id)}")
-    for craft_id in list(normalized_crafts.keys())[:3]:  # Show first 3 as examples
+    for craft_id in islice(normalized_crafts, 3):  # Show first 3 as examples
         print(f"  Craft: {Colors.highlight(craft_id)}")
     
     # Step 3: Resolve craft name conflicts
@@ -1286,13 +1460,10 @@ def main():
     # Step 6: Update craft item references based on ID changes
     if changes['items']['id_updates']:
         print_info("Updating craft item references...")
-        normalized_crafts = update_craft_item_references(normalized_crafts, changes['items']['id_updates'])
-        # Re-run comparison for crafts after updating references
-        updated_changes = compare_entities(normalized_items, normalized_crafts, bitcrafty_items, bitcrafty_crafts)
-        # Preserve description_updates from the previous comparison
-        if 'description_updates' in changes['items']:
-            updated_changes['items']['description_updates'] = changes['items']['description_updates']
-        changes = updated_changes
+        old_to_new_id = {old_id: update_info['new_id'] for old_id, update_info in changes['items']['id_updates'].items()}
+        normalized_crafts, touched_craft_ids = update_craft_item_references(normalized_crafts, old_to_new_id)
+        # Re-run comparison only for the crafts whose references changed; items are unaffected
+        recompare_crafts(changes, touched_craft_ids, normalized_crafts, bitcrafty_crafts)
     
     # Step 7: Extract and compare metadata
     print("\n" + Colors.section_divider("METADATA & REQUIREMENTS PROCESSING", 60))
@@ -1389,34 +1560,58 @@ def main():
     else:
         print_info("Reconciliation cancelled. No changes were applied.")
     
+# Accepted answers (letters or full words) for the interactive prompts, mapped to the action they select
+_NO_CHANGES_CHOICES = {'q': 'quit', 'quit': 'quit', 'b': 'backups', 'backup': 'backups', 'backups': 'backups'}
+_CONFIRM_CHOICES = {
+    'y': 'yes', 'yes': 'yes',
+    'n': 'no', 'no': 'no', '': 'no',
+    'd': 'details', 'details': 'details',
+    'b': 'backups', 'backup': 'backups', 'backups': 'backups',
+}
+_BACKUP_ACTION_CHOICES = {
+    'q': 'quit', 'quit': 'quit',
+    'v': 'validate', 'validate': 'validate',
+    'l': 'list', 'list': 'list',
+    'r': 'restore', 'restore': 'restore',
+    'c': 'clean', 'clean': 'clean',
+}
+
+
+def _read_choice(prompt_text, choices):
+    """Prompt once and return the action for the answer, or None if it isn't one of the choices."""
+    return choices.get(input(prompt_text).strip().lower())
+
+
 def prompt_for_confirmation(changes, metadata_changes, new_metadata, requirement_changes):
     """Prompt user for confirmation before applying changes."""
     print("\n" + Colors.section_divider("CONFIRMATION REQUIRED"))
     
-    total_changes = (
-        len(changes['items']['new']) + len(changes['items']['updated']) + len(changes['items']['id_updates']) +
-        len(changes['items'].get('description_updates', {})) +
-        len(changes['crafts']['new']) + len(changes['crafts']['updated']) +
-        len(metadata_changes['buildings']['new']) +
-        len(requirement_changes['new']) + len(requirement_changes['updated'])
-    )
+    # Short-circuit on the first non-empty category; the full count is only needed when there is something to show
+    has_changes = any((
+        changes['items']['new'], changes['items']['updated'], changes['items']['id_updates'],
+        changes['items'].get('description_updates'),
+        changes['crafts']['new'], changes['crafts']['updated'],
+        metadata_changes['buildings']['new'],
+        requirement_changes['new'], requirement_changes['updated'],
+    ))
     
-    if total_changes == 0:
+    if not has_changes:
         print_info("No changes needed. Everything is up to date!")
+        prompt_text = f"\n{Colors.colorize('No reconciliation needed. Would you like to access', Colors.BOLD)} [{Colors.colorize('B', Colors.CYAN)}ackups] or [{Colors.colorize('Q', Colors.GRAY)}uit]? "
         while True:
-            prompt_text = f"\n{Colors.colorize('No reconciliation needed. Would you like to access', Colors.BOLD)} [{Colors.colorize('B', Colors.CYAN)}ackups] or [{Colors.colorize('Q', Colors.GRAY)}uit]? "
-            response = input(prompt_text).strip().lower()
+            response = _read_choice(prompt_text, _NO_CHANGES_CHOICES)
             
-            if response in ['q', 'quit']:
+            if response == 'quit':
                 print_info("Exiting reconciliator.")
                 return False
-            elif response in ['b', 'backup', 'backups']:
+            elif response == 'backups':
                 show_backup_management()
                 continue
             else:
                 print_warning("Please enter 'Backups' or 'Quit' (letters or full words).")
     
-    print(f"\n{Colors.colorize('Ready to apply', Colors.BOLD)} {Colors.colorize(str(total_changes), Colors.BOLD + Colors.GREEN)} {Colors.colorize('changes to BitCrafty data:', Colors.BOLD)}")
+    total_changes = _count_total_changes(changes, metadata_changes, requirement_changes)
+    print(f"\n{Colors.colorize('Ready to apply', Colors.BOLD)} {Colors.colorize(str(total_changes), Colors.BOLD_GREEN)} {Colors.colorize('changes to BitCrafty data:', Colors.BOLD)}")
     print(f"  • {Colors.colorize(str(len(changes['items']['id_updates'])), Colors.YELLOW)} item ID updates")
     print(f"  • {Colors.colorize(str(len(changes['items']['new'])), Colors.GREEN)} new items")
     print(f"  • {Colors.colorize(str(len(changes['items']['updated'])), Colors.CYAN)} item updates")
@@ -1427,19 +1622,19 @@ def prompt_for_confirmation(changes, metadata_changes, new_metadata, requirement
     print(f"  • {Colors.colorize(str(len(requirement_changes['updated'])), Colors.CYAN)} requirement updates")
     print(f"  • {Colors.colorize(str(len(metadata_changes['buildings']['new'])), Colors.GREEN)} new buildings")
     
+    prompt_text = f"\n{Colors.colorize('Apply these changes?', Colors.BOLD)} [{Colors.colorize('Y', Colors.GREEN)}es/{Colors.colorize('N', Colors.RED)}o] or [{Colors.colorize('D', Colors.BLUE)}etails/{Colors.colorize('B', Colors.CYAN)}ackups]: "
     while True:
-        prompt_text = f"\n{Colors.colorize('Apply these changes?', Colors.BOLD)} [{Colors.colorize('Y', Colors.GREEN)}es/{Colors.colorize('N', Colors.RED)}o] or [{Colors.colorize('D', Colors.BLUE)}etails/{Colors.colorize('B', Colors.CYAN)}ackups]: "
-        response = input(prompt_text).strip().lower()
+        response = _read_choice(prompt_text, _CONFIRM_CHOICES)
         
-        if response in ['y', 'yes']:
+        if response == 'yes':
             return True
-        elif response in ['n', 'no', '']:
+        elif response == 'no':
             print_info("Changes cancelled.")
             return False
-        elif response in ['d', 'details']:
+        elif response == 'details':
             print_detailed_changes(changes, metadata_changes, new_metadata, requirement_changes)
             continue
-        elif response in ['b', 'backup', 'backups']:
+        elif response == 'backups':
             show_backup_management()
             continue
         else:
@@ -1462,25 +1657,25 @@ def show_backup_management():
         file_count = len(backup.get('files', []))
         print(f"  {Colors.colorize(str(i), Colors.BOLD)}. {Colors.highlight(backup['folder'])} - {Colors.gray(created_at)} {Colors.colorize(f'({file_count} files)', Colors.CYAN)}")
     
+    prompt_text = f"\n{Colors.colorize('Backup actions:', Colors.BOLD)} [{Colors.colorize('L', Colors.BLUE)}ist/{Colors.colorize('R', Colors.YELLOW)}estore/{Colors.colorize('C', Colors.RED)}lean/{Colors.colorize('V', Colors.GREEN)}alidate/{Colors.colorize('Q', Colors.GRAY)}uit]: "
     while True:
-        prompt_text = f"\n{Colors.colorize('Backup actions:', Colors.BOLD)} [{Colors.colorize('L', Colors.BLUE)}ist/{Colors.colorize('R', Colors.YELLOW)}estore/{Colors.colorize('C', Colors.RED)}lean/{Colors.colorize('V', Colors.GREEN)}alidate/{Colors.colorize('Q', Colors.GRAY)}uit]: "
-        action = input(prompt_text).strip().lower()
+        action = _read_choice(prompt_text, _BACKUP_ACTION_CHOICES)
         
-        if action in ['q', 'quit']:
+        if action == 'quit':
             break
-        elif action in ['v', 'validate']:
+        elif action == 'validate':
             print_info("Running data integrity validation...")
             is_valid = validate_data_integrity_post_change()
             if is_valid:
                 print_success("Data integrity validation passed!")
             else:
                 print_error("Data integrity validation failed - see errors above")
-        elif action in ['l', 'list']:
+        elif action == 'list':
             try:
                 backup_num = int(input(f"{Colors.colorize('Enter backup number to list files: ', Colors.CYAN)}")) - 1
                 if 0 <= backup_num < len(backups):
                     backup = backups[backup_num]
-                    print(f"\n{Colors.header(f'Files in backup {backup['folder']}:')}")
+                    print(f"\n{Colors.header('Files in backup ' + backup['folder'] + ':')}")
                     for file_name in backup.get('files', []):
                         print(f"  • {Colors.highlight(file_name)}")
                 else:
@@ -1488,8 +1683,8 @@ def show_backup_management():
             except ValueError:
                 print_error("Please enter a valid number.")
         
-        elif action in ['r', 'restore']:
-            print(f"\n{Colors.colorize('⚠️  WARNING:', Colors.BOLD + Colors.RED)} This will overwrite current BitCrafty data!")
+        elif action == 'restore':
+            print(f"\n{Colors.colorize('⚠️  WARNING:', Colors.BOLD_RED)} This will overwrite current BitCrafty data!")
             confirm = input(f"{Colors.colorize('Are you sure you want to restore? [Y/N]: ', Colors.YELLOW)}").strip().lower()
             if confirm in ['y', 'yes']:
                 try:
@@ -1507,7 +1702,7 @@ def show_backup_management():
             else:
                 print_info("Restore cancelled.")
         
-        elif action in ['c', 'clean']:
+        elif action == 'clean':
             try:
                 keep_count = int(input(f"{Colors.colorize('How many recent backups to keep? [default: 10]: ', Colors.CYAN)}") or "10")
                 cleanup_old_backups(keep_count)
@@ -1523,81 +1718,88 @@ def show_backup_management():
 
 def print_detailed_changes(changes, metadata_changes, new_metadata, requirement_changes):
     """Print detailed information about what will be changed."""
-    print("\n" + Colors.section_divider("DETAILED CHANGES", 60))
+    # Collect every line and write them in one go rather than one print per line
+    lines = []
+    emit = lines.append
+    emit("\n" + Colors.section_divider("DETAILED CHANGES", 60))
     
     if changes['items']['id_updates']:
-        print(f"\n{Colors.colorize('ITEM ID UPDATES:', Colors.BOLD + Colors.YELLOW)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('ITEM ID UPDATES:', Colors.BOLD_YELLOW)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
         
         for old_id, update_info in changes['items']['id_updates'].items():
             new_id = update_info['new_id']
             item_name = update_info['new']['name']
-            print(f"  {Colors.colorize(old_id, Colors.RED)} → {Colors.colorize(new_id, Colors.GREEN)}")
-            print(f"    {Colors.colorize('Name:', Colors.CYAN)} {item_name}")
-            print(f"    {Colors.colorize('Reason:', Colors.CYAN)} {update_info['reason']}")
+            emit(f"  {Colors.colorize(old_id, Colors.RED)} → {Colors.colorize(new_id, Colors.GREEN)}")
+            emit(f"    {Colors.label('Name:')} {item_name}")
+            emit(f"    {Colors.label('Reason:')} {update_info['reason']}")
     
     if changes['items']['new']:
-        print(f"\n{Colors.colorize('NEW ITEMS:', Colors.BOLD + Colors.GREEN)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('NEW ITEMS:', Colors.BOLD_GREEN)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
         for item_id, item in changes['items']['new'].items():
-            tier_color = Colors.get_tier_color(item.get('tier'))
-            tier_text = Colors.colorize(f"T{item.get('tier', '?')}", tier_color)
-            print(f"  {Colors.colorize('✓', Colors.GREEN)} Added new item: {Colors.highlight(item_id)} {Colors.gray(f'({tier_text})')}")
+            tier = item.get('tier', '?')
+            tier_text = Colors.colorize(f"T{tier}", Colors.get_tier_color(tier))
+            emit(f"  {Colors.CHECK} Added new item: {Colors.highlight(item_id)} {Colors.gray(f'({tier_text})')}")
     
     if changes['items'].get('description_updates'):
-        print(f"\n{Colors.colorize('DESCRIPTION UPDATES:', Colors.BOLD + Colors.CYAN)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('DESCRIPTION UPDATES:', Colors.BOLD_CYAN)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
         for item_id, update_info in changes['items']['description_updates'].items():
             item_name = update_info['existing']['name']
             description = update_info['description']
-            print(f"  {Colors.colorize('📝', Colors.CYAN)} {Colors.highlight(item_id)}: {item_name}")
-            print(f"    {Colors.colorize('Adding description:', Colors.CYAN)} {Colors.gray(description[:80] + ('...' if len(description) > 80 else ''))}")
+            emit(f"  {Colors.NOTE} {Colors.highlight(item_id)}: {item_name}")
+            emit(f"    {Colors.label('Adding description:')} {Colors.gray(description[:80] + ('...' if len(description) > 80 else ''))}")
     
     if changes['items']['updated']:
-        print(f"\n{Colors.colorize('UPDATED ITEMS:', Colors.BOLD + Colors.YELLOW)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('UPDATED ITEMS:', Colors.BOLD_YELLOW)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(ITEMS_DATA_PATH)}")
         for item_id, update_info in changes['items']['updated'].items():
             existing = update_info['existing']
             new = update_info['new']
-            print(f"  {Colors.colorize('✓', Colors.YELLOW)} Updated item: {Colors.highlight(item_id)}")
-            print(f"    {Colors.colorize('Name:', Colors.CYAN)} {existing.get('name', '')} → {new.get('name', '')}")
-            if existing.get('tier') != new.get('tier'):
-                print(f"    {Colors.colorize('Tier:', Colors.CYAN)} {existing.get('tier', 'None')} → {new.get('tier', 'None')}")
+            emit(f"  {Colors.colorize('✓', Colors.YELLOW)} Updated item: {Colors.highlight(item_id)}")
+            emit(f"    {Colors.label('Name:')} {existing.get('name', '')} → {new.get('name', '')}")
+            existing_tier = existing.get('tier')
+            new_tier = new.get('tier')
+            if existing_tier != new_tier:
+                emit(f"    {Colors.label('Tier:')} {existing_tier} → {new_tier}")
             if existing.get('description') != new.get('description'):
-                print(f"    {Colors.colorize('Description changed:', Colors.CYAN)} {Colors.gray('Yes')}")
+                emit(f"    {Colors.label('Description changed:')} {Colors.gray('Yes')}")
     
     if requirement_changes['new']:
-        print(f"\n{Colors.colorize('NEW REQUIREMENTS:', Colors.BOLD + Colors.GREEN)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(REQUIREMENTS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('NEW REQUIREMENTS:', Colors.BOLD_GREEN)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(REQUIREMENTS_DATA_PATH)}")
         
         for req_id, req_data in requirement_changes['new'].items():
             req_entry = req_data['entry']
-            craft_count = len(req_data['crafts'])
-            print(f"  {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(req_id)}: {req_entry['name']}")
-            print(f"    {Colors.colorize('Used by', Colors.CYAN)} {Colors.colorize(str(craft_count), Colors.YELLOW)} {Colors.colorize('crafts:', Colors.CYAN)} {Colors.gray(', '.join(req_data['crafts'][:3]))}{Colors.gray('...' if craft_count > 3 else '')}")
-            print(f"    {Colors.colorize('Profession:', Colors.CYAN)} {Colors.colorize(req_entry['profession']['name'], Colors.BLUE)}")
+            req_crafts = req_data['crafts']
+            craft_count = len(req_crafts)
+            emit(f"  {Colors.PLUS} {Colors.highlight(req_id)}: {req_entry['name']}")
+            emit(f"    {Colors.label('Used by')} {Colors.colorize(str(craft_count), Colors.YELLOW)} {Colors.label('crafts:')} {Colors.gray(', '.join(req_crafts[:3]))}{Colors.gray('...' if craft_count > 3 else '')}")
+            emit(f"    {Colors.label('Profession:')} {Colors.colorize(req_entry['profession']['name'], Colors.BLUE)}")
             if 'tool' in req_entry:
-                print(f"    {Colors.colorize('Tool:', Colors.CYAN)} {req_entry['tool']['name']}")
+                emit(f"    {Colors.label('Tool:')} {req_entry['tool']['name']}")
             if 'building' in req_entry:
-                print(f"    {Colors.colorize('Building:', Colors.CYAN)} {req_entry['building']['name']}")
+                emit(f"    {Colors.label('Building:')} {req_entry['building']['name']}")
     
     if requirement_changes['updated']:
-        print(f"\n{Colors.colorize('REQUIREMENT UPDATES:', Colors.BOLD + Colors.YELLOW)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(REQUIREMENTS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('REQUIREMENT UPDATES:', Colors.BOLD_YELLOW)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(REQUIREMENTS_DATA_PATH)}")
         
         for req_id, update_info in requirement_changes['updated'].items():
             existing = update_info['existing']
             new = update_info['new']
-            craft_count = len(update_info['crafts'])
+            req_crafts = update_info['crafts']
+            craft_count = len(req_crafts)
             
-            print(f"  {Colors.colorize('⚠️', Colors.YELLOW)} {Colors.highlight(req_id)}")
-            print(f"    {Colors.colorize('Used by', Colors.CYAN)} {Colors.colorize(str(craft_count), Colors.YELLOW)} {Colors.colorize('crafts:', Colors.CYAN)} {Colors.gray(', '.join(update_info['crafts'][:3]))}{Colors.gray('...' if craft_count > 3 else '')}")
+            emit(f"  {Colors.WARNING_MARK} {Colors.highlight(req_id)}")
+            emit(f"    {Colors.label('Used by')} {Colors.colorize(str(craft_count), Colors.YELLOW)} {Colors.label('crafts:')} {Colors.gray(', '.join(req_crafts[:3]))}{Colors.gray('...' if craft_count > 3 else '')}")
             
             # Compare names
             existing_name = existing.get('name', '')
             new_name = new.get('name', '')
             if existing_name.lower().strip() != new_name.lower().strip():
-                print(f"    {Colors.colorize('Name:', Colors.CYAN)} '{existing_name}' → '{new_name}'")
+                emit(f"    {Colors.label('Name:')} '{existing_name}' → '{new_name}'")
             
             # Compare professions
             existing_prof = existing.get('profession', {})
@@ -1605,7 +1807,7 @@ def print_detailed_changes(changes, metadata_changes, new_metadata, requirement_
             existing_prof_name = existing_prof.get('name', '') if isinstance(existing_prof, dict) else str(existing_prof)
             new_prof_name = new_prof.get('name', '') if isinstance(new_prof, dict) else str(new_prof)
             if existing_prof_name.lower().strip() != new_prof_name.lower().strip():
-                print(f"    {Colors.colorize('Profession:', Colors.CYAN)} '{existing_prof_name}' → '{new_prof_name}'")
+                emit(f"    {Colors.label('Profession:')} '{existing_prof_name}' → '{new_prof_name}'")
             
             # Compare tools
             existing_tool = existing.get('tool', {})
@@ -1614,11 +1816,11 @@ def print_detailed_changes(changes, metadata_changes, new_metadata, requirement_
             new_tool_name = new_tool.get('name', '') if isinstance(new_tool, dict) else str(new_tool or '')
             if existing_tool_name.lower().strip() != new_tool_name.lower().strip():
                 if existing_tool_name and new_tool_name:
-                    print(f"    {Colors.colorize('Tool:', Colors.CYAN)} '{existing_tool_name}' → '{new_tool_name}'")
+                    emit(f"    {Colors.label('Tool:')} '{existing_tool_name}' → '{new_tool_name}'")
                 elif existing_tool_name and not new_tool_name:
-                    print(f"    {Colors.colorize('Tool:', Colors.CYAN)} '{existing_tool_name}' → {Colors.colorize('(removed)', Colors.RED)}")
+                    emit(f"    {Colors.label('Tool:')} '{existing_tool_name}' → {Colors.colorize('(removed)', Colors.RED)}")
                 elif not existing_tool_name and new_tool_name:
-                    print(f"    {Colors.colorize('Tool:', Colors.CYAN)} {Colors.colorize('(none)', Colors.GRAY)} → '{new_tool_name}'")
+                    emit(f"    {Colors.label('Tool:')} {Colors.colorize('(none)', Colors.GRAY)} → '{new_tool_name}'")
             
             # Compare buildings
             existing_building = existing.get('building', {})
@@ -1627,87 +1829,91 @@ def print_detailed_changes(changes, metadata_changes, new_metadata, requirement_
             new_building_name = new_building.get('name', '') if isinstance(new_building, dict) else str(new_building or '')
             if existing_building_name.lower().strip() != new_building_name.lower().strip():
                 if existing_building_name and new_building_name:
-                    print(f"    {Colors.colorize('Building:', Colors.CYAN)} '{existing_building_name}' → '{new_building_name}'")
+                    emit(f"    {Colors.label('Building:')} '{existing_building_name}' → '{new_building_name}'")
                 elif existing_building_name and not new_building_name:
-                    print(f"    {Colors.colorize('Building:', Colors.CYAN)} '{existing_building_name}' → {Colors.colorize('(removed)', Colors.RED)}")
+                    emit(f"    {Colors.label('Building:')} '{existing_building_name}' → {Colors.colorize('(removed)', Colors.RED)}")
                 elif not existing_building_name and new_building_name:
-                    print(f"    {Colors.colorize('Building:', Colors.CYAN)} {Colors.colorize('(none)', Colors.GRAY)} → '{new_building_name}'")
+                    emit(f"    {Colors.label('Building:')} {Colors.colorize('(none)', Colors.GRAY)} → '{new_building_name}'")
     
     if changes['crafts']['new']:
-        print(f"\n{Colors.colorize('NEW CRAFTS:', Colors.BOLD + Colors.GREEN)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(CRAFTS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('NEW CRAFTS:', Colors.BOLD_GREEN)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(CRAFTS_DATA_PATH)}")
         
         for craft_id, craft in changes['crafts']['new'].items():
-            print(f"  {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(craft_id)}: {craft['name']}")
-            if craft.get('requirement'):
-                print(f"    {Colors.colorize('Requirement:', Colors.CYAN)} {Colors.gray(craft['requirement'])}")
-            if craft.get('materials'):
-                material_count = len(craft['materials'])
-                print(f"    {Colors.colorize('Materials:', Colors.CYAN)} {Colors.colorize(str(material_count), Colors.YELLOW)} items")
-            if craft.get('outputs'):
-                output_count = len(craft['outputs'])
-                print(f"    {Colors.colorize('Outputs:', Colors.CYAN)} {Colors.colorize(str(output_count), Colors.YELLOW)} items")
+            emit(f"  {Colors.PLUS} {Colors.highlight(craft_id)}: {craft['name']}")
+            requirement = craft.get('requirement')
+            materials = craft.get('materials')
+            outputs = craft.get('outputs')
+            if requirement:
+                emit(f"    {Colors.label('Requirement:')} {Colors.gray(requirement)}")
+            if materials:
+                material_count = len(materials)
+                emit(f"    {Colors.label('Materials:')} {Colors.colorize(str(material_count), Colors.YELLOW)} items")
+            if outputs:
+                output_count = len(outputs)
+                emit(f"    {Colors.label('Outputs:')} {Colors.colorize(str(output_count), Colors.YELLOW)} items")
     
     if changes['crafts']['updated']:
-        print(f"\n{Colors.colorize('CRAFT UPDATES:', Colors.BOLD + Colors.YELLOW)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(CRAFTS_DATA_PATH)}")
+        emit(f"\n{Colors.colorize('CRAFT UPDATES:', Colors.BOLD_YELLOW)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(CRAFTS_DATA_PATH)}")
         
         for craft_id, update_info in changes['crafts']['updated'].items():
             existing = update_info['existing']
             new = update_info['new']
             reasons = update_info.get('changes', [])
             
-            print(f"  {Colors.colorize('⚠️', Colors.YELLOW)} {Colors.highlight(craft_id)}: {existing.get('name', '')}")
+            emit(f"  {Colors.WARNING_MARK} {Colors.highlight(craft_id)}: {existing.get('name', '')}")
             if reasons:
-                print(f"    {Colors.colorize('Change type:', Colors.CYAN)} {', '.join(reasons)}")
+                emit(f"    {Colors.label('Change type:')} {', '.join(reasons)}")
             
             # Compare names
             if existing.get('name', '').strip().lower() != new.get('name', '').strip().lower():
-                print(f"    {Colors.colorize('Name:', Colors.CYAN)} '{existing.get('name', '')}' → '{new.get('name', '')}'")
+                emit(f"    {Colors.label('Name:')} '{existing.get('name', '')}' → '{new.get('name', '')}'")
             
             # Compare requirements
             existing_req = existing.get('requirement', '').strip()
             new_req = new.get('requirement', '').strip()
             if existing_req != new_req:
                 if existing_req and new_req:
-                    print(f"    {Colors.colorize('Requirement:', Colors.CYAN)} '{existing_req}' → '{new_req}'")
+                    emit(f"    {Colors.label('Requirement:')} '{existing_req}' → '{new_req}'")
                 elif existing_req and not new_req:
-                    print(f"    {Colors.colorize('Requirement:', Colors.CYAN)} '{existing_req}' → {Colors.colorize('(removed)', Colors.RED)}")
+                    emit(f"    {Colors.label('Requirement:')} '{existing_req}' → {Colors.colorize('(removed)', Colors.RED)}")
                 elif not existing_req and new_req:
-                    print(f"    {Colors.colorize('Requirement:', Colors.CYAN)} {Colors.colorize('(none)', Colors.GRAY)} → '{new_req}'")
+                    emit(f"    {Colors.label('Requirement:')} {Colors.colorize('(none)', Colors.GRAY)} → '{new_req}'")
             
             # Compare materials
             existing_materials = existing.get('materials', [])
             new_materials = new.get('materials', [])
             if len(existing_materials) != len(new_materials):
-                print(f"    {Colors.colorize('Materials count:', Colors.CYAN)} {len(existing_materials)} → {len(new_materials)}")
+                emit(f"    {Colors.label('Materials count:')} {len(existing_materials)} → {len(new_materials)}")
             elif existing_materials != new_materials:
-                print(f"    {Colors.colorize('Materials:', Colors.CYAN)} {Colors.colorize('Content changed', Colors.YELLOW)}")
+                emit(f"    {Colors.label('Materials:')} {Colors.colorize('Content changed', Colors.YELLOW)}")
                 # Show specific material differences
                 for i, (existing_mat, new_mat) in enumerate(zip(existing_materials, new_materials)):
                     if existing_mat != new_mat:
-                        print(f"      {Colors.colorize(f'Material {i+1}:', Colors.GRAY)} {existing_mat} → {new_mat}")
+                        emit(f"      {Colors.colorize(f'Material {i+1}:', Colors.GRAY)} {existing_mat} → {new_mat}")
             
             # Compare outputs
             existing_outputs = existing.get('outputs', [])
             new_outputs = new.get('outputs', [])
             if len(existing_outputs) != len(new_outputs):
-                print(f"    {Colors.colorize('Outputs count:', Colors.CYAN)} {len(existing_outputs)} → {len(new_outputs)}")
+                emit(f"    {Colors.label('Outputs count:')} {len(existing_outputs)} → {len(new_outputs)}")
             elif existing_outputs != new_outputs:
-                print(f"    {Colors.colorize('Outputs:', Colors.CYAN)} {Colors.colorize('Content changed', Colors.YELLOW)}")
+                emit(f"    {Colors.label('Outputs:')} {Colors.colorize('Content changed', Colors.YELLOW)}")
                 # Show specific output differences
                 for i, (existing_out, new_out) in enumerate(zip(existing_outputs, new_outputs)):
                     if existing_out != new_out:
-                        print(f"      {Colors.colorize(f'Output {i+1}:', Colors.GRAY)} {existing_out} → {new_out}")
+                        emit(f"      {Colors.colorize(f'Output {i+1}:', Colors.GRAY)} {existing_out} → {new_out}")
     
     if metadata_changes['buildings']['new']:
-        print(f"\n{Colors.colorize('NEW BUILDINGS:', Colors.BOLD + Colors.GREEN)}")
-        print(f"{Colors.gray('File:')} {Colors.highlight(BUILDINGS_META_PATH)}")
+        emit(f"\n{Colors.colorize('NEW BUILDINGS:', Colors.BOLD_GREEN)}")
+        emit(f"{Colors.gray('File:')} {Colors.highlight(BUILDINGS_META_PATH)}")
         
         for building_data in new_metadata['buildings']:
-            print(f"  {Colors.colorize('+', Colors.GREEN)} {Colors.highlight(building_data['id'])}: {building_data['name']}")
+            emit(f"  {Colors.PLUS} {Colors.highlight(building_data['id'])}: {building_data['name']}")
     
-    print(f"\n{Colors.colorize('Total changes:', Colors.BOLD)} {Colors.colorize(str(_count_total_changes(changes, metadata_changes, requirement_changes)), Colors.YELLOW)}")
+    emit(f"\n{Colors.colorize('Total changes:', Colors.BOLD)} {Colors.colorize(str(_count_total_changes(changes, metadata_changes, requirement_changes)), Colors.YELLOW)}")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def _count_total_changes(changes, metadata_changes, requirement_changes):
@@ -1721,6 +1927,53 @@ def _count_total_changes(changes, metadata_changes, requirement_changes):
     )
 
 
+def _index_entries_by_id(entries):
+    """Map each ID to the positions of the entries carrying it, in file order."""
+    index = defaultdict(list)
+    for position, entry in enumerate(entries):
+        index[entry.get('id')].append(position)
+    return index
+
+
+def _reindex_entry(index, old_id, new_id):
+    """Move the first entry filed under old_id to new_id, returning its position (None if absent)."""
+    positions = index.get(old_id)
+    if not positions:
+        return None
+    position = positions.pop(0)
+    if not positions:
+        del index[old_id]
+    insort(index[new_id], position)
+    return position
+
+
+def _replace_entry(entries, index, entry_id, new_entry):
+    """Replace the first entry with the given ID, keeping the index in step. Returns False if absent."""
+    positions = index.get(entry_id)
+    if not positions:
+        return False
+    entries[positions[0]] = new_entry
+    if new_entry.get('id') != entry_id:
+        _reindex_entry(index, entry_id, new_entry.get('id'))
+    return True
+
+
+_CRAFT_REF_FIELDS = ('materials', 'outputs')
+
+
+def _index_craft_item_refs(crafts_data):
+    """Map each referenced item ID to (craft position, 0 for materials / 1 for outputs, entry position) keys.
+
+    The keys sort in the order a scan of the crafts would reach them.
+    """
+    refs = defaultdict(list)
+    for craft_position, craft in enumerate(crafts_data):
+        for kind, field in enumerate(_CRAFT_REF_FIELDS):
+            for entry_position, entry in enumerate(craft.get(field, ())):
+                refs[entry.get('item')].append((craft_position, kind, entry_position))
+    return refs
+
+
 def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requirement_changes, normalized_crafts):
     """
     Apply changes to BitCrafty data files in the correct order:
@@ -1734,12 +1987,10 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
     
     try:
         # Load current BitCrafty data
-        items_data = load_json(ITEMS_DATA_PATH)
-        crafts_data = load_json(CRAFTS_DATA_PATH)
-        requirements_data = load_json(REQUIREMENTS_DATA_PATH)
-        buildings_data = load_json(BUILDINGS_META_PATH)
-        professions_data = load_json(PROFESSIONS_META_PATH)
-        tools_data = load_json(TOOLS_META_PATH)
+        items_data, crafts_data, requirements_data, buildings_data, professions_data, tools_data = load_json_files([
+            ITEMS_DATA_PATH, CRAFTS_DATA_PATH, REQUIREMENTS_DATA_PATH,
+            BUILDINGS_META_PATH, PROFESSIONS_META_PATH, TOOLS_META_PATH,
+        ])
         
         changes_applied = 0
         
@@ -1752,29 +2003,29 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             print_info(f"Adding {Colors.colorize(str(count), Colors.YELLOW)} new buildings...")
             for building_data in new_metadata['buildings']:
                 buildings_data.append(building_data)
-                print(f"  {Colors.colorize('✓', Colors.GREEN)} Added building: {Colors.highlight(building_data['id'])}")
+                print(f"  {Colors.CHECK} Added building: {Colors.highlight(building_data['id'])}")
                 changes_applied += 1
             
             # Handle profession-specific stations that need to be created based on craft requirements
             station_professions = set()
-            for craft_id, craft in normalized_crafts.items():
+            for craft in normalized_crafts.values():
                 requirements = craft.get('requirements', {})
                 profession = requirements.get('profession')
-                building = requirements.get('building', '').lower()
-                if profession and 'station' in building:
+                if profession and 'station' in requirements.get('building', '').lower():
                     # Normalize profession name
-                    normalized_profession = normalize_name(profession)
-                    station_professions.add(normalized_profession)
+                    station_professions.add(normalize_name(profession))
             
             # Create missing station buildings
+            existing_building_ids = {b.get('id') for b in buildings_data}
             for profession in station_professions:
                 station_id = f"building:{profession}:station"
-                if not any(b.get('id') == station_id for b in buildings_data):
+                if station_id not in existing_building_ids:
                     buildings_data.append({
                         'id': station_id,
                         'name': f"{profession.title()} Station"
                     })
-                    print(f"  {Colors.colorize('✓', Colors.GREEN)} Added profession station: {Colors.highlight(station_id)}")
+                    existing_building_ids.add(station_id)
+                    print(f"  {Colors.CHECK} Added profession station: {Colors.highlight(station_id)}")
                     changes_applied += 1
         
         # Add new tools
@@ -1783,7 +2034,7 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             print_info(f"Adding {Colors.colorize(str(count), Colors.YELLOW)} new tools...")
             for tool_data in new_metadata['tools']:
                 tools_data.append(tool_data)
-                print(f"  {Colors.colorize('✓', Colors.GREEN)} Added tool: {Colors.highlight(tool_data['id'])}")
+                print(f"  {Colors.CHECK} Added tool: {Colors.highlight(tool_data['id'])}")
                 changes_applied += 1
         
         # Add new professions
@@ -1798,41 +2049,39 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
                     'name': prof_data['name'],  # Keep original name for display
                     'color': prof_data['color']
                 })
-                print(f"  {Colors.colorize('✓', Colors.GREEN)} Added profession: profession:{normalized_prof_name}")
+                print(f"  {Colors.CHECK} Added profession: profession:{normalized_prof_name}")
                 changes_applied += 1
         
         # STEP 2: Insert/Update Items
         print_header("\n2. INSERTING/UPDATING ITEMS")
         
+        # Index items and crafts by ID once instead of scanning the lists for every change
+        items_by_id = _index_entries_by_id(items_data)
+        crafts_by_id = _index_entries_by_id(crafts_data)
+        
         # Apply item ID updates first
         if changes['items']['id_updates']:
             count = len(changes['items']['id_updates'])
             print_info(f"Updating {Colors.colorize(str(count), Colors.YELLOW)} item IDs...")
+            craft_item_refs = _index_craft_item_refs(crafts_data)
             for old_id, update_info in changes['items']['id_updates'].items():
                 new_id = update_info['new_id']
                 # Find and update item
-                for item in items_data:
-                    if item['id'] == old_id:
-                        item['id'] = new_id
-                        print(f"  {Colors.colorize('✓', Colors.GREEN)} Updated item ID: {Colors.colorize(old_id, Colors.RED)} → {Colors.colorize(new_id, Colors.GREEN)}")
-                        changes_applied += 1
-                        break
+                position = _reindex_entry(items_by_id, old_id, new_id)
+                if position is not None:
+                    items_data[position]['id'] = new_id
+                    print(f"  {Colors.CHECK} Updated item ID: {Colors.colorize(old_id, Colors.RED)} → {Colors.colorize(new_id, Colors.GREEN)}")
+                    changes_applied += 1
                 
-                # Update references in crafts
-                for craft in crafts_data:
-                    # Update materials
-                    if 'materials' in craft:
-                        for material in craft['materials']:
-                            if material.get('item') == old_id:
-                                material['item'] = new_id
-                                print(f"  {Colors.colorize('✓', Colors.GREEN)} Updated craft material reference: {Colors.gray(old_id)} → {Colors.gray(new_id)}")
-                    
-                    # Update outputs
-                    if 'outputs' in craft:
-                        for output in craft['outputs']:
-                            if output.get('item') == old_id:
-                                output['item'] = new_id
-                                print(f"  {Colors.colorize('✓', Colors.GREEN)} Updated craft output reference: {Colors.gray(old_id)} → {Colors.gray(new_id)}")
+                # Update references in crafts (materials, then outputs, craft by craft)
+                refs = craft_item_refs.pop(old_id, None)
+                if refs:
+                    for craft_position, kind, entry_position in refs:
+                        field = _CRAFT_REF_FIELDS[kind]
+                        crafts_data[craft_position][field][entry_position]['item'] = new_id
+                        label = 'material' if field == 'materials' else 'output'
+                        print(f"  {Colors.CHECK} Updated craft {label} reference: {Colors.gray(old_id)} → {Colors.gray(new_id)}")
+                    craft_item_refs[new_id] = sorted(craft_item_refs.get(new_id, []) + refs)
         
         # Apply description updates to existing items
         if changes['items'].get('description_updates'):
@@ -1841,15 +2090,15 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             for item_id, update_info in changes['items']['description_updates'].items():
                 description = update_info['description']
                 # Find and update item
-                for item in items_data:
-                    if item['id'] == item_id:
-                        item['description'] = description
-                        item_name = item['name']
-                        description_preview = description[:50] + ('...' if len(description) > 50 else '')
-                        print(f"  {Colors.colorize('📝', Colors.CYAN)} Updated description for: {Colors.highlight(item_id)} ({item_name})")
-                        print(f"    {Colors.gray(description_preview)}")
-                        changes_applied += 1
-                        break
+                positions = items_by_id.get(item_id)
+                if positions:
+                    item = items_data[positions[0]]
+                    item['description'] = description
+                    item_name = item['name']
+                    description_preview = description[:50] + ('...' if len(description) > 50 else '')
+                    print(f"  {Colors.NOTE} Updated description for: {Colors.highlight(item_id)} ({item_name})")
+                    print(f"    {Colors.gray(description_preview)}")
+                    changes_applied += 1
         
         # Update existing items
         if changes['items']['updated']:
@@ -1858,14 +2107,11 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             for item_id, update_info in changes['items']['updated'].items():
                 new_item = clean_item_for_bitcrafty(update_info['new'])
                 # Find and replace the existing item
-                for i, item in enumerate(items_data):
-                    if item['id'] == item_id:
-                        items_data[i] = new_item
-                        tier_color = Colors.get_tier_color(new_item.get('tier'))
-                        tier_text = Colors.colorize(f"T{new_item.get('tier', '?')}", tier_color)
-                        print(f"  {Colors.colorize('✓', Colors.GREEN)} Updated item: {Colors.highlight(item_id)} {Colors.gray(f'({tier_text})')}")
-                        changes_applied += 1
-                        break
+                if _replace_entry(items_data, items_by_id, item_id, new_item):
+                    tier = new_item.get('tier', '?')
+                    tier_text = Colors.colorize(f"T{tier}", Colors.get_tier_color(tier))
+                    print(f"  {Colors.CHECK} Updated item: {Colors.highlight(item_id)} {Colors.gray(f'({tier_text})')}")
+                    changes_applied += 1
         
         # Add new items
         if changes['items']['new']:
@@ -1874,9 +2120,9 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             for item_id, item in changes['items']['new'].items():
                 clean_item = clean_item_for_bitcrafty(item)
                 items_data.append(clean_item)
-                tier_color = Colors.get_tier_color(clean_item.get('tier'))
-                tier_text = Colors.colorize(f"T{clean_item.get('tier', '?')}", tier_color)
-                print(f"  {Colors.colorize('✓', Colors.GREEN)} Added item: {Colors.highlight(item_id)} {Colors.gray(f'({tier_text})')}")
+                tier = clean_item.get('tier', '?')
+                tier_text = Colors.colorize(f"T{tier}", Colors.get_tier_color(tier))
+                print(f"  {Colors.CHECK} Added item: {Colors.highlight(item_id)} {Colors.gray(f'({tier_text})')}")
                 changes_applied += 1
         
         # STEP 3: Insert Requirements
@@ -1887,7 +2133,7 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             print_info(f"Adding {Colors.colorize(str(count), Colors.YELLOW)} new requirements...")
             for req_id, req_data in requirement_changes['new'].items():
                 requirements_data.append(req_data['entry'])
-                print(f"  {Colors.colorize('✓', Colors.GREEN)} Added requirement: {Colors.highlight(req_id)}")
+                print(f"  {Colors.CHECK} Added requirement: {Colors.highlight(req_id)}")
                 changes_applied += 1
         
         # STEP 4: Insert/Update Crafts
@@ -1900,7 +2146,7 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             
             # Create ExportManager for intelligent merging
             try:
-                merge_manager = ExportManager()
+                merge_manager = create_export_manager()
             except Exception as e:
                 print(f"[WARNING] Could not create ExportManager for merging: {e}")
                 merge_manager = None
@@ -1918,13 +2164,10 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
                     merged_craft = clean_craft_for_bitcrafty(update_info['new'])
                 
                 # Find and replace the existing craft
-                for i, craft in enumerate(crafts_data):
-                    if craft['id'] == craft_id:
-                        crafts_data[i] = merged_craft
-                        reason = ', '.join(update_info.get('changes', ['update']))
-                        print(f"  {Colors.colorize('✓', Colors.GREEN)} Updated craft: {Colors.highlight(craft_id)} ({reason})")
-                        changes_applied += 1
-                        break
+                if _replace_entry(crafts_data, crafts_by_id, craft_id, merged_craft):
+                    reason = ', '.join(update_info.get('changes', ['update']))
+                    print(f"  {Colors.CHECK} Updated craft: {Colors.highlight(craft_id)} ({reason})")
+                    changes_applied += 1
         
         # Add new crafts
         if changes['crafts']['new']:
@@ -1933,17 +2176,19 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
             for craft_id, craft in changes['crafts']['new'].items():
                 clean_craft = clean_craft_for_bitcrafty(craft)
                 crafts_data.append(clean_craft)
-                print(f"  {Colors.colorize('✓', Colors.GREEN)} Added craft: {Colors.highlight(craft_id)}: {craft['name']}")
+                print(f"  {Colors.CHECK} Added craft: {Colors.highlight(craft_id)}: {craft['name']}")
                 changes_applied += 1
         
         # Write all updated files
         print_header("\n5. SAVING FILES")
-        write_json(items_data, ITEMS_DATA_PATH)
-        write_json(crafts_data, CRAFTS_DATA_PATH)
-        write_json(requirements_data, REQUIREMENTS_DATA_PATH)
-        write_json(buildings_data, BUILDINGS_META_PATH)
-        write_json(professions_data, PROFESSIONS_META_PATH)
-        write_json(tools_data, TOOLS_META_PATH)
+        write_json_files([
+            (items_data, ITEMS_DATA_PATH),
+            (crafts_data, CRAFTS_DATA_PATH),
+            (requirements_data, REQUIREMENTS_DATA_PATH),
+            (buildings_data, BUILDINGS_META_PATH),
+            (professions_data, PROFESSIONS_META_PATH),
+            (tools_data, TOOLS_META_PATH),
+        ])
         
         print_success(f"Applied {Colors.colorize(str(changes_applied), Colors.BOLD)} changes successfully!")
         print_info("Updated files:")
@@ -1957,7 +2202,7 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
         # Run post-change validation
         print_header("\n6. VALIDATION")
         print_info("Running post-change data integrity verification...")
-        validation_passed = validate_data_integrity_post_change()
+        validation_passed = validate_data_integrity_post_change(_touched_entity_ids(changes, requirement_changes))
         
         if not validation_passed:
             print_error("Data integrity validation FAILED after applying changes!")
@@ -1972,17 +2217,6 @@ def apply_changes_in_correct_order(changes, metadata_changes, new_metadata, requ
         return False
 
 
-def clean_item_for_bitcrafty(item):
-    """Clean item data to match BitCrafty format exactly - remove extractor metadata."""
-    return {
-        'id': item['id'],
-        'name': item['name'],
-        'description': item.get('description', ''),  # Include description in BitCrafty format
-        'tier': item.get('tier', 1),
-        'rank': item.get('rank', 'Common')
-    }
-
-
 def ensure_item_references_exist(normalized_crafts, normalized_items):
     """
     Ensure all item references in crafts exist in normalized_items.
@@ -1990,24 +2224,17 @@ def ensure_item_references_exist(normalized_crafts, normalized_items):
     """
     print_info("Verifying all craft item references exist...")
     
-    # Get all item IDs referenced in crafts
-    referenced_items = set()
-    
-    for craft_id, craft in normalized_crafts.items():
-        # Check materials
-        for material in craft.get('materials', []):
-            item_ref = material.get('item')
-            if item_ref:
-                referenced_items.add(item_ref)
-        
-        # Check outputs
-        for output in craft.get('outputs', []):
-            item_ref = output.get('item')
-            if item_ref:
-                referenced_items.add(item_ref)
+    # Get all item IDs referenced in crafts (materials and outputs)
+    referenced_items = {
+        item_ref
+        for craft in normalized_crafts.values()
+        for field in _CRAFT_REF_FIELDS
+        for entry in craft.get(field, [])
+        if (item_ref := entry.get('item'))
+    }
     
-    # Check which items are missing
-    missing_items = referenced_items - set(normalized_items.keys())
+    # Check which items are missing; difference() probes the dict directly instead of copying its keys
+    missing_items = referenced_items.difference(normalized_items)
     
     if missing_items:
         print_warning(f"Found {len(missing_items)} item references without matching items. Creating placeholder items...")
@@ -2028,13 +2255,35 @@ def ensure_item_references_exist(normalized_crafts, normalized_items):
                         'tier': 1,
                         'rank': 'Common'
                     }
-                    print(f"  {Colors.colorize('✓', Colors.GREEN)} Created placeholder item: {Colors.highlight(item_id)} ({name_part})")
+                    print(f"  {Colors.CHECK} Created placeholder item: {Colors.highlight(item_id)} ({name_part})")
     
     return normalized_items
 
 
+# Key layouts of entries already in BitCrafty format (order matters - it is the order written to disk)
+_CLEAN_ITEM_KEYS = ('id', 'name', 'description', 'tier', 'rank')
+_CLEAN_CRAFT_KEYS = (('id', 'name', 'materials', 'outputs'), ('id', 'name', 'materials', 'outputs', 'requirement'))
+
+
+def _touched_entity_ids(changes, requirement_changes):
+    """IDs of the items, crafts and requirements a reconciliation wrote, including the old IDs of renamed items."""
+    touched = set(changes['items']['new'])
+    touched.update(changes['items']['updated'])
+    for old_id, update_info in changes['items']['id_updates'].items():
+        touched.add(old_id)
+        touched.add(update_info['new_id'])
+    touched.update(changes['crafts']['new'])
+    touched.update(changes['crafts']['updated'])
+    touched.update(requirement_changes['new'])
+    touched.update(requirement_changes['updated'])
+    return touched
+
+
 def clean_item_for_bitcrafty(item):
     """Clean item data to match BitCrafty format exactly - remove extractor metadata."""
+    if tuple(item) == _CLEAN_ITEM_KEYS:
+        # Already clean - nothing to strip or default
+        return item
     return {
         'id': item['id'],
         'name': item['name'],
@@ -2046,6 +2295,9 @@ def clean_item_for_bitcrafty(item):
 
 def clean_craft_for_bitcrafty(craft):
     """Clean craft data to match BitCrafty format exactly - remove extractor metadata."""
+    if tuple(craft) in _CLEAN_CRAFT_KEYS:
+        # Already clean - nothing to strip or default
+        return craft
     clean_craft = {
         'id': craft['id'],
         'name': craft['name'],
@@ -2062,8 +2314,33 @@ def clean_craft_for_bitcrafty(craft):
 
 def write_json(data, file_path):
     """Write JSON data to file with proper formatting."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_json(file_path, data)
+
+
+def write_json_files(files):
+    """Write several (data, file_path) pairs concurrently, one thread per file.
+
+    Each file is written atomically by save_json; the first failure is re-raised once all writes finish.
+    """
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        futures = [executor.submit(write_json, data, file_path) for data, file_path in files]
+    for future in futures:
+        future.result()
+
+
+def _backup_file_paths():
+    """Map each backed-up file's path inside a backup folder to its BitCrafty data file.
+
+    Built per call rather than at import so it follows the current *_PATH settings.
+    """
+    return {
+        'items.json': ITEMS_DATA_PATH,
+        'crafts.json': CRAFTS_DATA_PATH,
+        'requirements.json': REQUIREMENTS_DATA_PATH,
+        'metadata/professions.json': PROFESSIONS_META_PATH,
+        'metadata/tools.json': TOOLS_META_PATH,
+        'metadata/buildings.json': BUILDINGS_META_PATH,
+    }
 
 
 def create_backup():
@@ -2075,27 +2352,26 @@ def create_backup():
         # Create backup directory if it doesn't exist
         os.makedirs(backup_folder, exist_ok=True)
         
-        # List of files to backup
-        files_to_backup = [
-            ('items.json', ITEMS_DATA_PATH),
-            ('crafts.json', CRAFTS_DATA_PATH),
-            ('requirements.json', REQUIREMENTS_DATA_PATH),
-            ('metadata/professions.json', PROFESSIONS_META_PATH),
-            ('metadata/tools.json', TOOLS_META_PATH),
-            ('metadata/buildings.json', BUILDINGS_META_PATH)
-        ]
-        
         backed_up_files = []
+        copy_jobs = []
         
-        for relative_path, source_path in files_to_backup:
+        for relative_path, source_path in _backup_file_paths().items():
             if os.path.exists(source_path):
-                # Create subdirectories if needed
+                # Create subdirectories up front so the copy threads never race on them
                 backup_file_path = os.path.join(backup_folder, relative_path)
                 backup_dir = os.path.dirname(backup_file_path)
                 os.makedirs(backup_dir, exist_ok=True)
-                
-                # Copy the file
-                shutil.copy2(source_path, backup_file_path)
+                copy_jobs.append((relative_path, source_path, backup_file_path))
+        
+        # Copy the files concurrently; results are collected in list order for the manifest
+        if copy_jobs:
+            with ThreadPoolExecutor(max_workers=len(copy_jobs)) as executor:
+                futures = [
+                    (relative_path, executor.submit(shutil.copy2, source_path, backup_file_path))
+                    for relative_path, source_path, backup_file_path in copy_jobs
+                ]
+            for relative_path, future in futures:
+                future.result()
                 backed_up_files.append(relative_path)
                 print(f"[BACKUP] Backed up: {relative_path}")
         
@@ -2109,8 +2385,7 @@ def create_backup():
         }
         
         manifest_path = os.path.join(backup_folder, 'backup_manifest.json')
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        save_json(manifest_path, manifest)
         
         print(f"[BACKUP] Created backup: {backup_folder}")
         print(f"[BACKUP] Backed up {len(backed_up_files)} files")
@@ -2127,21 +2402,23 @@ def list_available_backups():
         return []
     
     backups = []
-    for item in os.listdir(BACKUPS_DIR):
-        backup_path = os.path.join(BACKUPS_DIR, item)
-        if os.path.isdir(backup_path) and item.startswith('backup_'):
-            manifest_path = os.path.join(backup_path, 'backup_manifest.json')
-            if os.path.exists(manifest_path):
+    # scandir reports entry types from the directory listing, avoiding a stat per entry
+    with os.scandir(BACKUPS_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith('backup_') and entry.is_dir():
+                manifest_path = os.path.join(entry.path, 'backup_manifest.json')
                 try:
-                    with open(manifest_path, 'r', encoding='utf-8') as f:
-                        manifest = json.load(f)
+                    with open(manifest_path, 'rb') as f:
+                        manifest = _parse_json_bytes(f.read())
                     backups.append({
-                        'folder': item,
-                        'path': backup_path,
+                        'folder': entry.name,
+                        'path': entry.path,
                         'timestamp': manifest.get('timestamp'),
                         'created_at': manifest.get('created_at'),
                         'files': manifest.get('backed_up_files', [])
                     })
+                except FileNotFoundError:
+                    pass  # No manifest, so not a complete backup
                 except Exception as e:
                     print(f"[WARN] Could not read backup manifest: {manifest_path} - {e}")
     
@@ -2159,39 +2436,37 @@ def restore_from_backup(backup_path):
         return False
     
     try:
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = load_json(manifest_path)
         
         print(f"[RESTORE] Restoring from backup created at: {manifest.get('created_at')}")
         
         # Restore each file
         restored_files = []
+        copy_jobs = []
+        target_paths = _backup_file_paths()
         for relative_path in manifest.get('backed_up_files', []):
             backup_file_path = os.path.join(backup_path, relative_path)
             
             # Determine target path
-            if relative_path == 'items.json':
-                target_path = ITEMS_DATA_PATH
-            elif relative_path == 'crafts.json':
-                target_path = CRAFTS_DATA_PATH
-            elif relative_path == 'requirements.json':
-                target_path = REQUIREMENTS_DATA_PATH
-            elif relative_path == 'metadata/professions.json':
-                target_path = PROFESSIONS_META_PATH
-            elif relative_path == 'metadata/tools.json':
-                target_path = TOOLS_META_PATH
-            elif relative_path == 'metadata/buildings.json':
-                target_path = BUILDINGS_META_PATH
-            else:
+            target_path = target_paths.get(relative_path)
+            if target_path is None:
                 continue
             
             if os.path.exists(backup_file_path):
                 # Create target directory if needed
                 target_dir = os.path.dirname(target_path)
                 os.makedirs(target_dir, exist_ok=True)
-                
-                # Copy the file
-                shutil.copy2(backup_file_path, target_path)
+                copy_jobs.append((relative_path, backup_file_path, target_path))
+        
+        # Copy the files concurrently, like create_backup; results are reported in manifest order
+        if copy_jobs:
+            with ThreadPoolExecutor(max_workers=len(copy_jobs)) as executor:
+                futures = [
+                    (relative_path, executor.submit(shutil.copy2, backup_file_path, target_path))
+                    for relative_path, backup_file_path, target_path in copy_jobs
+                ]
+            for relative_path, future in futures:
+                future.result()
                 restored_files.append(relative_path)
                 print(f"[RESTORE] Restored: {relative_path}")
         
@@ -2214,14 +2489,38 @@ def cleanup_old_backups(keep_count=10):
     
     print(f"[CLEANUP] Removing {len(backups_to_delete)} old backups (keeping {keep_count} most recent)")
     
-    for backup in backups_to_delete:
+    # Remove the folders concurrently; outcomes are reported in list order
+    with ThreadPoolExecutor(max_workers=len(backups_to_delete)) as executor:
+        futures = [(backup, executor.submit(shutil.rmtree, backup['path'])) for backup in backups_to_delete]
+    for backup, future in futures:
         try:
-            shutil.rmtree(backup['path'])
+            future.result()
             print(f"[CLEANUP] Removed backup: {backup['folder']}")
         except Exception as e:
             print(f"[WARN] Could not remove backup {backup['folder']}: {e}")
 
 
+@lru_cache(maxsize=1024)
+def _parse_requirement_part(value):
+    """Split a tool/building requirement into its cleaned lowercase name and tier (default 1)."""
+    # Convert Roman numerals to Arabic first
+    clean = convert_roman_to_arabic(value).lower()
+    # Dynamic tier extraction using regex
+    tier_match = _RE_TIER_NUMBER.search(clean)
+    if tier_match:
+        return _RE_TIER_NUMBER.sub('', clean).strip(), int(tier_match.group(1))
+    return clean, 1
+
+
+def _requirement_signature(profession, tool, building):
+    """Signature identifying a craft's requirement: (profession, tool, tool tier, building, building tier)."""
+    # Normalize profession name (lowercase, no apostrophes)
+    normalized_profession = normalize_name(profession)
+    tool_clean, tool_tier = _parse_requirement_part(tool) if tool and tool != 'null' else (None, 1)
+    building_clean, building_tier = _parse_requirement_part(building) if building and building != 'null' else (None, 1)
+    return (normalized_profession, tool_clean, tool_tier, building_clean, building_tier)
+
+
 def extract_requirements_from_crafts(normalized_crafts):
     """Extract unique requirements from normalized crafts and create requirement entries following BitCrafty convention."""
     
@@ -2237,36 +2536,9 @@ def extract_requirements_from_crafts(normalized_crafts):
         if not profession:
             continue
         
-        # Normalize profession name (lowercase, no apostrophes)
-        normalized_profession = normalize_name(profession)
-            
-        # Extract tier information and clean names dynamically
-        tool_clean = None
-        tool_tier = 1
-        if tool and tool != 'null' and tool is not None:
-            # Convert Roman numerals to Arabic first
-            tool_normalized = convert_roman_to_arabic(tool)
-            tool_clean = tool_normalized.lower()
-            # Dynamic tier extraction using regex
-            tier_match = re.search(r'tier\s*(\d+)', tool_clean)
-            if tier_match:
-                tool_tier = int(tier_match.group(1))
-                tool_clean = re.sub(r'tier\s*\d+\s*', '', tool_clean).strip()
-            
-        building_clean = None
-        building_tier = 1
-        if building and building != 'null' and building is not None:
-            # Convert Roman numerals to Arabic first
-            building_normalized = convert_roman_to_arabic(building)
-            building_clean = building_normalized.lower()
-            # Dynamic tier extraction using regex
-            tier_match = re.search(r'tier\s*(\d+)', building_clean)
-            if tier_match:
-                building_tier = int(tier_match.group(1))
-                building_clean = re.sub(r'tier\s*\d+\s*', '', building_clean).strip()
-        
         # Create requirement signature (includes tiers and normalized profession)
-        signature = (normalized_profession, tool_clean, tool_tier, building_clean, building_tier)
+        signature = _requirement_signature(profession, tool, building)
+        normalized_profession, tool_clean, tool_tier, building_clean, building_tier = signature
         
         if signature not in requirements_by_signature:
             # Create requirement ID following BitCrafty convention with dynamic tiers
@@ -2337,7 +2609,7 @@ def extract_requirements_from_crafts(normalized_crafts):
                 'crafts': []
             }
             
-            print(f"[DEBUG] Created requirement: {requirement_id} -> {req_name}")
+            log.debug("Created requirement: %s -> %s", requirement_id, req_name)
         
         # Track which crafts use this requirement
         requirements_by_signature[signature]['crafts'].append(craft_id)
@@ -2345,6 +2617,21 @@ def extract_requirements_from_crafts(normalized_crafts):
     return requirements_by_signature
 
 
+def _requirement_ref_name(ref):
+    """Name of a requirement's profession/tool/building, whether stored as {'name': ...} or a plain value."""
+    return ref.get('name', '') if isinstance(ref, dict) else str(ref)
+
+
+def _requirement_comparison_key(req):
+    """Case-insensitive (name, profession, tool, building) tuple used to tell whether a requirement changed."""
+    return (
+        req.get('name', '').lower().strip(),
+        _requirement_ref_name(req.get('profession', {})).lower().strip(),
+        _requirement_ref_name(req.get('tool') or '').lower().strip(),
+        _requirement_ref_name(req.get('building') or '').lower().strip(),
+    )
+
+
 def compare_requirements(extracted_requirements, existing_requirements):
     """Compare extracted requirements with existing BitCrafty requirements."""
     requirement_changes = {
@@ -2353,13 +2640,15 @@ def compare_requirements(extracted_requirements, existing_requirements):
         'updated': {}
     }
     
-    # Index existing requirements by ID
+    # Index existing requirements (and their comparison keys) by ID
     existing_by_id = {}
+    existing_keys_by_id = {}
     if existing_requirements:
         for req in existing_requirements:
             req_id = req.get('id')
             if req_id:
                 existing_by_id[req_id] = req
+                existing_keys_by_id[req_id] = _requirement_comparison_key(req)
     
     # Compare extracted requirements
     for signature, req_data in extracted_requirements.items():
@@ -2368,36 +2657,9 @@ def compare_requirements(extracted_requirements, existing_requirements):
         
         if req_id in existing_by_id:
             existing_req = existing_by_id[req_id]
-            # Intelligent requirement comparison - compare actual content, not structure
-            needs_update = False
-            
-            # Compare name (case-insensitive)
-            if req_entry.get('name', '').lower().strip() != existing_req.get('name', '').lower().strip():
-                needs_update = True
-                
-            # Compare profession (extract name from both structures)
-            new_prof = req_entry.get('profession', {})
-            existing_prof = existing_req.get('profession', {})
-            new_prof_name = new_prof.get('name', '') if isinstance(new_prof, dict) else str(new_prof)
-            existing_prof_name = existing_prof.get('name', '') if isinstance(existing_prof, dict) else str(existing_prof)
-            if new_prof_name.lower().strip() != existing_prof_name.lower().strip():
-                needs_update = True
-                
-            # Compare tool (extract name from both structures)  
-            new_tool = req_entry.get('tool', {})
-            existing_tool = existing_req.get('tool', {})
-            new_tool_name = new_tool.get('name', '') if isinstance(new_tool, dict) else str(new_tool or '')
-            existing_tool_name = existing_tool.get('name', '') if isinstance(existing_tool, dict) else str(existing_tool or '')
-            if new_tool_name.lower().strip() != existing_tool_name.lower().strip():
-                needs_update = True
-                
-            # Compare building (extract name from both structures)
-            new_building = req_entry.get('building', {})
-            existing_building = existing_req.get('building', {})
-            new_building_name = new_building.get('name', '') if isinstance(new_building, dict) else str(new_building or '')
-            existing_building_name = existing_building.get('name', '') if isinstance(existing_building, dict) else str(existing_building or '')
-            if new_building_name.lower().strip() != existing_building_name.lower().strip():
-                needs_update = True
+            # Intelligent requirement comparison - compare actual content (name, profession, tool,
+            # building names, case-insensitive), not structure
+            needs_update = _requirement_comparison_key(req_entry) != existing_keys_by_id[req_id]
             
             if needs_update:
                 requirement_changes['updated'][req_id] = {
@@ -2405,19 +2667,19 @@ def compare_requirements(extracted_requirements, existing_requirements):
                     'new': req_entry,
                     'crafts': req_data['crafts']
                 }
-                print(f"[INFO] Requirement needs update: {req_id}")
+                log.info("Requirement needs update: %s", req_id)
             else:
                 requirement_changes['existing'][req_id] = {
                     'entry': req_entry,
                     'crafts': req_data['crafts']
                 }
-                print(f"[DEBUG] Requirement already exists: {req_id}")
+                log.debug("Requirement already exists: %s", req_id)
         else:
             requirement_changes['new'][req_id] = {
                 'entry': req_entry,
                 'crafts': req_data['crafts']
             }
-            print(f"[INFO] New requirement needed: {req_id}")
+            log.info("New requirement needed: %s", req_id)
     
     return requirement_changes
 
@@ -2428,7 +2690,8 @@ def update_crafts_with_requirements(normalized_crafts, extracted_requirements):
     updated_crafts = {}
     
     for craft_id, craft in normalized_crafts.items():
-        updated_craft = deepcopy(craft)
+        # Only top-level keys change, so a shallow copy is enough (nested lists stay shared)
+        updated_craft = craft.copy()
         requirements = craft.get('requirements', {})
         
         profession = requirements.get('profession')
@@ -2436,67 +2699,38 @@ def update_crafts_with_requirements(normalized_crafts, extracted_requirements):
         building = requirements.get('building')
         
         if profession:
-            # Normalize profession name (same as in extract_requirements_from_crafts)
-            normalized_profession = normalize_name(profession)
-            
-            # Extract tier information and clean names (same logic as extract_requirements_from_crafts)
-            tool_clean = None
-            tool_tier = 1
-            if tool and tool != 'null' and tool is not None:
-                # Convert Roman numerals to Arabic first
-                tool_normalized = convert_roman_to_arabic(tool)
-                tool_clean = tool_normalized.lower()
-                # Dynamic tier extraction using regex
-                tier_match = re.search(r'tier\s*(\d+)', tool_clean)
-                if tier_match:
-                    tool_tier = int(tier_match.group(1))
-                    tool_clean = re.sub(r'tier\s*\d+\s*', '', tool_clean).strip()
-                
-            building_clean = None
-            building_tier = 1
-            if building and building != 'null' and building is not None:
-                # Convert Roman numerals to Arabic first
-                building_normalized = convert_roman_to_arabic(building)
-                building_clean = building_normalized.lower()
-                # Dynamic tier extraction using regex
-                tier_match = re.search(r'tier\s*(\d+)', building_clean)
-                if tier_match:
-                    building_tier = int(tier_match.group(1))
-                    building_clean = re.sub(r'tier\s*\d+\s*', '', building_clean).strip()
-            
-            # Create signature to match with extracted requirements
-            signature = (normalized_profession, tool_clean, tool_tier, building_clean, building_tier)
+            # Create signature to match with extracted requirements (same as extract_requirements_from_crafts)
+            signature = _requirement_signature(profession, tool, building)
             
             # Find the requirement ID for this signature
-            for sig, req_data in extracted_requirements.items():
-                if sig == signature:
-                    # Replace requirements object with requirement ID reference (BitCrafty format)
-                    updated_craft['requirement'] = req_data['id']
-                    # Remove the old requirements object
-                    if 'requirements' in updated_craft:
-                        del updated_craft['requirements']
-                    print(f"[DEBUG] Updated craft {craft_id} to use requirement: {req_data['id']}")
-                    break
+            req_data = extracted_requirements.get(signature)
+            if req_data:
+                # Replace requirements object with requirement ID reference (BitCrafty format)
+                updated_craft['requirement'] = req_data['id']
+                # Remove the old requirements object
+                updated_craft.pop('requirements', None)
+                log.debug("Updated craft %s to use requirement: %s", craft_id, req_data['id'])
         
         updated_crafts[craft_id] = updated_craft
     
     return updated_crafts
 
-def validate_data_integrity_post_change():
+def validate_data_integrity_post_change(touched_ids=None):
     """
     Validate BitCrafty data integrity after applying changes.
     Uses similar validation logic to the CI data-validation.test.js
+
+    touched_ids optionally limits the per-entity checks to the items, crafts and requirements a
+    reconciliation just wrote (see DataIntegrityValidator.run_all_validations).
     """
     print("\n" + Colors.section_divider("DATA INTEGRITY VALIDATION", 60))
     
     try:
         # Reload all data files to get fresh state
-        items_data = load_json(ITEMS_DATA_PATH)
-        crafts_data = load_json(CRAFTS_DATA_PATH)
-        requirements_data = load_json(REQUIREMENTS_DATA_PATH)
-        professions_meta = load_json(PROFESSIONS_META_PATH)
-        tools_meta = load_json(TOOLS_META_PATH)
-        buildings_meta = load_json(BUILDINGS_META_PATH)
+        items_data, crafts_data, requirements_data, professions_meta, tools_meta, buildings_meta = load_json_files([
+            ITEMS_DATA_PATH, CRAFTS_DATA_PATH, REQUIREMENTS_DATA_PATH,
+            PROFESSIONS_META_PATH, TOOLS_META_PATH, BUILDINGS_META_PATH,
+        ])
         
         if not all([items_data, crafts_data, requirements_data, professions_meta, tools_meta, buildings_meta]):
             print_error("Could not load all data files for validation")
@@ -2508,14 +2742,14 @@ def validate_data_integrity_post_change():
         )
         
         # Run all validation checks
-        is_valid = validator.run_all_validations()
+        is_valid = validator.run_all_validations(touched_ids)
         
         if is_valid:
-            print(f"\n{Colors.colorize('✅ Data integrity verification PASSED', Colors.BOLD + Colors.GREEN)}")
+            print(f"\n{Colors.colorize('✅ Data integrity verification PASSED', Colors.BOLD_GREEN)}")
             validator.print_summary()
             return True
         else:
-            print(f"\n{Colors.colorize('❌ Data integrity verification FAILED', Colors.BOLD + Colors.RED)}")
+            print(f"\n{Colors.colorize('❌ Data integrity verification FAILED', Colors.BOLD_RED)}")
             validator.print_errors()
             return False
             
@@ -2524,13 +2758,23 @@ def validate_data_integrity_post_change():
         return False
 
 
+# Shared read-only default for absent or null requirement references, so none is allocated per lookup
+_NO_REF = MappingProxyType({})
+
+
+def _entity_ids(entities):
+    """Set of the non-empty IDs in a list of entities."""
+    return {entity_id for entity in entities if (entity_id := entity.get('id'))}
+
+
 class DataIntegrityValidator:
     """
     Data integrity validator based on BitCrafty's data-validation.test.js
     Ensures all references are valid and data structure is consistent.
     """
     
-    def __init__(self, items_data, crafts_data, requirements_data, professions_meta, tools_meta, buildings_meta):
+    def __init__(self, items_data, crafts_data, requirements_data, professions_meta, tools_meta, buildings_meta,
+                 item_ids=None, craft_ids=None):
         self.items = items_data or []
         self.crafts = crafts_data or []
         self.requirements = requirements_data or []
@@ -2540,7 +2784,20 @@ class DataIntegrityValidator:
         
         self.errors = []
         self.warnings = []
-        self.create_lookup_sets()
+        self.touched_ids = None
+        self.create_lookup_sets(item_ids=item_ids, craft_ids=craft_ids)
+    
+    @classmethod
+    def from_autofix(cls, autofix):
+        """Create a validator from an AutoFixValidator, reusing copies of its ID lookups where they are current"""
+        # Profession fixes rename items in place; a rename onto (or away from) a duplicated ID
+        # leaves the fixer's dict-based index out of step with items_data, so recompute then
+        item_ids = None if autofix._item_ids_renamed else set(autofix._item_id_set)
+        return cls(
+            autofix.items_data, autofix.crafts_data, autofix.requirements_data,
+            autofix.professions_meta, autofix.tools_meta, autofix.buildings_meta,
+            item_ids=item_ids, craft_ids=set(autofix.craft_lookup),
+        )
     
     def error(self, message):
         self.errors.append(message)
@@ -2548,11 +2805,17 @@ class DataIntegrityValidator:
     def warning(self, message):
         self.warnings.append(message)
     
-    def create_lookup_sets(self):
+    def create_lookup_sets(self, item_ids=None, craft_ids=None):
         """Create lookup sets for quick validation (like the JS version)"""
-        self.item_ids = set(item.get('id') for item in self.items if item.get('id'))
-        self.craft_ids = set(craft.get('id') for craft in self.crafts if craft.get('id'))
-        self.requirement_ids = set(req.get('id') for req in self.requirements if req.get('id'))
+        if item_ids is None:
+            item_ids = _entity_ids(self.items)
+        if craft_ids is None:
+            craft_ids = _entity_ids(self.crafts)
+        self.item_ids = item_ids
+        self.craft_ids = craft_ids
+        self.requirement_ids = _entity_ids(self.requirements)
+        # Built on the first broken reference (see _items_by_profession)
+        self._item_name_index = None
         
         # Extract profession names from metadata
         self.profession_names = set()
@@ -2566,9 +2829,27 @@ class DataIntegrityValidator:
                 normalized_prof = normalize_name(prof_id)
                 self.profession_names.add(normalized_prof)
         
-        self.tool_ids = set(tool.get('id') for tool in self.tools if tool.get('id'))
-        self.building_ids = set(building.get('id') for building in self.buildings if building.get('id'))
-        self.profession_ids = set(prof.get('id') for prof in self.professions if prof.get('id'))
+        self.tool_ids = _entity_ids(self.tools)
+        self.building_ids = _entity_ids(self.buildings)
+        self.profession_ids = _entity_ids(self.professions)
+    
+    def _entities_to_check(self, entities):
+        """All entities, or only those whose ID is in touched_ids when validating incrementally"""
+        if self.touched_ids is None:
+            return entities
+        return [entity for entity in entities if entity.get('id') in self.touched_ids]
+    
+    def _crafts_to_check_references(self):
+        """Crafts whose item references need checking: touched crafts plus any craft pointing at a touched item"""
+        if self.touched_ids is None:
+            return self.crafts
+        touched = self.touched_ids
+        return [
+            craft for craft in self.crafts
+            if craft.get('id') in touched
+            or any(entry.get('item') in touched for entry in craft.get('materials', craft.get('inputs', [])))
+            or any(entry.get('item') in touched for entry in craft.get('outputs', []))
+        ]
     
     def extract_profession_from_id(self, entity_id):
         """Extract profession from entity ID (format: type:profession:identifier)"""
@@ -2586,7 +2867,7 @@ class DataIntegrityValidator:
     
     def validate_craft_item_references(self):
         """Validate all item IDs in crafts are valid"""
-        for craft in self.crafts:
+        for craft in self._crafts_to_check_references():
             craft_id = craft.get('id', 'unknown')
             
             # Check materials/inputs
@@ -2613,6 +2894,18 @@ class DataIntegrityValidator:
                     if suggested_fix:
                         self.error(f'  → Suggested fix: use "{suggested_fix}" instead')
     
+    def _items_by_profession(self):
+        """Existing item IDs grouped by profession as (name part, name part without plain-/hyphens, item ID)"""
+        if self._item_name_index is None:
+            index = defaultdict(list)
+            for item_id in self.item_ids:
+                parts = item_id.split(':')
+                if len(parts) >= 3 and parts[0] == 'item':
+                    name_part = parts[2]
+                    index[parts[1]].append((name_part, name_part.replace('plain-', '').replace('-', ''), item_id))
+            self._item_name_index = index
+        return self._item_name_index
+    
     def suggest_item_fix(self, broken_item_id):
         """Suggest a fix for a broken item reference by finding similar existing items"""
         if not broken_item_id or ':' not in broken_item_id:
@@ -2626,60 +2919,49 @@ class DataIntegrityValidator:
         broken_profession = parts[1]
         broken_name_part = parts[2]
         
+        broken_compact = broken_name_part.replace('-', '')
+        
         # Look for items with similar names in the same profession
-        for item_id in self.item_ids:
-            if item_id.startswith(f"item:{broken_profession}:"):
-                existing_name_part = item_id.split(':')[2]
-                
-                # Check for common patterns that might indicate a match
-                if broken_name_part in existing_name_part or existing_name_part in broken_name_part:
-                    return item_id
-                
-                # Check for "plain-" prefix pattern
-                if broken_name_part.replace('-', '') == existing_name_part.replace('plain-', '').replace('-', ''):
-                    return item_id
+        for existing_name_part, existing_compact, item_id in self._items_by_profession().get(broken_profession, ()):
+            # Check for common patterns that might indicate a match
+            if broken_name_part in existing_name_part or existing_name_part in broken_name_part:
+                return item_id
+            
+            # Check for "plain-" prefix pattern
+            if broken_compact == existing_compact:
+                return item_id
         
         return None
     
     def validate_entity_profession_categories(self):
         """Validate entity ID profession categories"""
-        # Validate items
-        for item in self.items:
-            item_id = item.get('id')
-            if not item_id:
-                self.error(f'Item missing ID: {item}')
-                continue
-                
-            if not self.is_valid_entity_id_format(item_id, 'item'):
-                self.error(f'Item "{item_id}" has invalid ID format (expected: item:profession:identifier)')
+        self._validate_id_professions(self.items, 'item')
+        self._validate_id_professions(self.crafts, 'craft')
+    
+    def _validate_id_professions(self, entities, entity_type):
+        """Check ID format and profession of items or crafts, splitting each ID once"""
+        label = entity_type.capitalize()
+        for entity in self._entities_to_check(entities):
+            entity_id = entity.get('id')
+            if not entity_id:
+                self.error(f'{label} missing ID: {entity}')
                 continue
             
-            profession = self.extract_profession_from_id(item_id)
-            if not profession:
-                self.error(f'Item "{item_id}" has no profession in ID')
-            elif profession not in self.profession_names:
-                self.error(f'Item "{item_id}" has invalid profession "{profession}" (not found in professions metadata)')
-        
-        # Validate crafts
-        for craft in self.crafts:
-            craft_id = craft.get('id')
-            if not craft_id:
-                self.error(f'Craft missing ID: {craft}')
-                continue
-                
-            if not self.is_valid_entity_id_format(craft_id, 'craft'):
-                self.error(f'Craft "{craft_id}" has invalid ID format (expected: craft:profession:identifier)')
+            # Same checks as is_valid_entity_id_format and extract_profession_from_id
+            parts = entity_id.split(':')
+            if len(parts) != 3 or parts[0] != entity_type:
+                self.error(f'{label} "{entity_id}" has invalid ID format (expected: {entity_type}:profession:identifier)')
                 continue
             
-            profession = self.extract_profession_from_id(craft_id)
+            profession = parts[1]
             if not profession:
-                self.error(f'Craft "{craft_id}" has no profession in ID')
+                self.error(f'{label} "{entity_id}" has no profession in ID')
             elif profession not in self.profession_names:
-                self.error(f'Craft "{craft_id}" has invalid profession "{profession}" (not found in professions metadata)')
+                self.error(f'{label} "{entity_id}" has invalid profession "{profession}" (not found in professions metadata)')
     
     def validate_craft_requirements(self):
         """Validate all crafts have valid requirements"""
-        for craft in self.crafts:
+        for craft in self._entities_to_check(self.crafts):
             craft_id = craft.get('id', 'unknown')
             requirement_ref = craft.get('requirement')
             
@@ -2690,15 +2972,20 @@ class DataIntegrityValidator:
     
     def validate_requirement_metadata_references(self):
         """Validate requirement entity IDs with metadata"""
-        for req in self.requirements:
+        for req in self._entities_to_check(self.requirements):
             req_id = req.get('id', 'unknown')
             
             # Validate requirement ID format
             if not self.is_valid_entity_id_format(req_id, 'requirement'):
                 self.error(f'Requirement "{req_id}" has invalid ID format (expected: requirement:profession:identifier)')
             
+            # Absent and null references (e.g. "tool": null) both read as empty
+            profession = req.get('profession') or _NO_REF
+            tool = req.get('tool') or _NO_REF
+            building = req.get('building') or _NO_REF
+            
             # Validate profession reference
-            profession_ref = req.get('profession', {}).get('name')
+            profession_ref = profession.get('name')
             if profession_ref:
                 if profession_ref not in self.profession_ids:
                     self.error(f'Requirement "{req_id}" references non-existent profession "{profession_ref}"')
@@ -2706,50 +2993,42 @@ class DataIntegrityValidator:
                 self.error(f'Requirement "{req_id}" is missing profession.name')
             
             # Validate tool reference (if present)
-            tool_ref = req.get('tool', {}).get('name')
+            tool_ref = tool.get('name')
             if tool_ref and tool_ref not in self.tool_ids:
                 self.error(f'Requirement "{req_id}" references non-existent tool "{tool_ref}"')
             
             # Validate building reference (if present)
-            building_ref = req.get('building', {}).get('name')
+            building_ref = building.get('name')
             if building_ref and building_ref not in self.building_ids:
                 self.error(f'Requirement "{req_id}" references non-existent building "{building_ref}"')
             
             # Validate level values
-            prof_level = req.get('profession', {}).get('level')
+            prof_level = profession.get('level')
             if prof_level is not None and (not isinstance(prof_level, int) or prof_level < 1):
                 self.error(f'Requirement "{req_id}" has invalid profession level: {prof_level}')
             
-            tool_level = req.get('tool', {}).get('level')
+            tool_level = tool.get('level')
             if tool_level is not None and (not isinstance(tool_level, int) or tool_level < 1):
                 self.error(f'Requirement "{req_id}" has invalid tool level: {tool_level}')
             
-            building_level = req.get('building', {}).get('level')
+            building_level = building.get('level')
             if building_level is not None and (not isinstance(building_level, int) or building_level < 1):
                 self.error(f'Requirement "{req_id}" has invalid building level: {building_level}')
     
     def validate_data_integrity(self):
         """Additional data integrity checks"""
-        # Check for duplicate IDs
-        all_entities = []
-        for item in self.items:
-            if item.get('id'):
-                all_entities.append(('item', item.get('id')))
-        for craft in self.crafts:
-            if craft.get('id'):
-                all_entities.append(('craft', craft.get('id')))
-        for req in self.requirements:
-            if req.get('id'):
-                all_entities.append(('requirement', req.get('id')))
-        
-        all_ids = [entity[1] for entity in all_entities]
+        # Check for duplicate IDs (across items, crafts and requirements) in a single pass
         seen_ids = set()
         duplicate_ids = set()
-        
-        for entity_id in all_ids:
-            if entity_id in seen_ids:
-                duplicate_ids.add(entity_id)
-            seen_ids.add(entity_id)
+        for entities in (self.items, self.crafts, self.requirements):
+            for entity in entities:
+                entity_id = entity.get('id')
+                if not entity_id:
+                    continue
+                if entity_id in seen_ids:
+                    duplicate_ids.add(entity_id)
+                else:
+                    seen_ids.add(entity_id)
         
         for dup_id in duplicate_ids:
             self.error(f'Duplicate ID found: {dup_id}')
@@ -2775,8 +3054,13 @@ class DataIntegrityValidator:
 
                 self.warning(f'Requirement "{req_id}" is not used by any craft')
     
-    def run_all_validations(self):
-        """Run all validation checks and return True if no errors"""
+    def run_all_validations(self, touched_ids=None):
+        """Run all validation checks and return True if no errors
+
+        With touched_ids, the per-entity checks only look at those items, crafts and requirements (and at
+        crafts referencing a touched item); the cross-entity checks in validate_data_integrity always run in full.
+        """
+        self.touched_ids = touched_ids
         self.validate_craft_item_references()
         self.validate_entity_profession_categories()
         self.validate_craft_requirements()
@@ -2788,7 +3072,7 @@ class DataIntegrityValidator:
     def print_summary(self):
         """Print validation summary"""
         total_entities = len(self.items) + len(self.crafts) + len(self.requirements)
-        print(f"\n{Colors.colorize('Validation Summary:', Colors.BOLD + Colors.CYAN)}")
+        print(f"\n{Colors.colorize('Validation Summary:', Colors.BOLD_CYAN)}")
         print(f"  Validated {Colors.colorize(str(total_entities), Colors.YELLOW)} entities:")
         print(f"    • {Colors.colorize(str(len(self.items)), Colors.GREEN)} items")
         print(f"    • {Colors.colorize(str(len(self.crafts)), Colors.GREEN)} crafts")
@@ -2797,21 +3081,27 @@ class DataIntegrityValidator:
         if self.warnings:
             print(f"\n   {Colors.colorize(f'{len(self.warnings)} warnings found:', Colors.YELLOW)}")
             for warning in self.warnings[:3]:  # Show first 3 warnings
-                print(f"    {Colors.colorize('⚠️', Colors.YELLOW)}  {Colors.gray(warning)}")
+                print(f"    {Colors.WARNING_MARK}  {Colors.gray(warning)}")
             if len(self.warnings) > 3:
                 print(f"    {Colors.gray(f'... and {len(self.warnings) - 3} more warnings')}")
     
     def print_errors(self):
         """Print all validation errors"""
-        print(f"\n{Colors.colorize(f'{len(self.errors)} errors found:', Colors.BOLD + Colors.RED)}")
+        print(f"\n{Colors.colorize(f'{len(self.errors)} errors found:', Colors.BOLD_RED)}")
         for error in self.errors:
             print(f"  {Colors.colorize('❌', Colors.RED)} {error}")
         
         if self.warnings:
             print(f"\n{Colors.colorize(f'{len(self.warnings)} warnings:', Colors.YELLOW)}")
             for warning in self.warnings:
-                print(f"  {Colors.colorize('⚠️', Colors.YELLOW)}  {Colors.gray(warning)}")
+                print(f"  {Colors.WARNING_MARK}  {Colors.gray(warning)}")
 
 
 if __name__ == "__main__":
+    # Set RECONCILIATOR_LOG_LEVEL=DEBUG to see the per-item normalization trace
+    logging.basicConfig(
+        level=os.environ.get('RECONCILIATOR_LOG_LEVEL', 'INFO').upper(),
+        format='[%(levelname)s] %(message)s',
+        stream=sys.stdout
+    )
     main()
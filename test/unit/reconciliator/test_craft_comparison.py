@@ -0,0 +1,65 @@
+"""
+Unit tests for the reconciliator's ExportManager-backed craft comparison.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "reconciliator"))
+
+from reconciliator import intelligent_craft_comparison
+
+
+@pytest.fixture
+def existing_craft():
+    """Existing BitCrafty craft."""
+    return {
+        'id': 'craft:farming:plant-seeds',
+        'name': 'Plant Seeds',
+        'materials': [{'item': 'item:farming:seeds', 'qty': 1}],
+        'outputs': [{'item': 'item:farming:sprout', 'qty': 1}],
+        'requirement': 'requirement:farming:basic',
+    }
+
+
+@pytest.fixture
+def export_manager():
+    """ExportManager stand-in that always prefers the new craft."""
+    manager = Mock()
+    manager._should_update_existing_craft.return_value = True
+    manager._has_better_quantities.return_value = False
+    return manager
+
+
+@pytest.mark.unit
+class TestIntelligentCraftComparison:
+    """Test the identical-recipe shortcut."""
+
+    def test_identical_craft_skips_export_manager(self, existing_craft, export_manager):
+        """Test an identical recipe with the same requirement is not sent to the ExportManager."""
+        should_update, _ = intelligent_craft_comparison(dict(existing_craft), existing_craft, export_manager)
+
+        assert not should_update
+        export_manager._should_update_existing_craft.assert_not_called()
+
+    def test_requirement_difference_reaches_export_manager(self, existing_craft, export_manager):
+        """Test crafts differing only in requirements are still compared by the ExportManager."""
+        new_craft = dict(existing_craft, requirement='requirement:farming:tier2-farming-station')
+
+        should_update, _ = intelligent_craft_comparison(new_craft, existing_craft, export_manager)
+
+        assert should_update
+        export_manager._should_update_existing_craft.assert_called_once()
+
+    def test_inline_requirements_reach_export_manager(self, existing_craft, export_manager):
+        """Test a craft still carrying inline requirements is not treated as identical."""
+        new_craft = dict(existing_craft, requirements={'profession': 'farming', 'building': 'Tier 1 Farming Station'})
+        del new_craft['requirement']
+
+        should_update, _ = intelligent_craft_comparison(new_craft, existing_craft, export_manager)
+
+        assert should_update
+        export_manager._should_update_existing_craft.assert_called_once()
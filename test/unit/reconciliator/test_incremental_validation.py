@@ -0,0 +1,207 @@
+"""
+Unit tests for incremental post-reconciliation validation.
+
+After applying a reconciliation only the touched entities (and crafts that
+reference a touched item) are validated. These tests check that dangling
+references caused by the reconciliation are still reported exactly as a full
+validation reports them, and cover the ID index helpers used while applying.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "reconciliator"))
+
+from reconciliator import (
+    DataIntegrityValidator,
+    _index_entries_by_id,
+    _reindex_entry,
+    _replace_entry,
+    _touched_entity_ids,
+)
+
+
+@pytest.fixture
+def bitcrafty_data():
+    """Small, valid BitCrafty dataset."""
+    return {
+        'items': [
+            {'id': 'item:carpentry:plank', 'name': 'Plank'},
+            {'id': 'item:carpentry:table', 'name': 'Table'},
+            {'id': 'item:tailoring:cloth', 'name': 'Cloth'},
+            {'id': 'item:tailoring:rag', 'name': 'Rag'},
+        ],
+        'crafts': [
+            {
+                'id': 'craft:carpentry:make-table', 'name': 'Make Table',
+                'materials': [{'item': 'item:carpentry:plank', 'qty': 4}],
+                'outputs': [{'item': 'item:carpentry:table', 'qty': 1}],
+                'requirement': 'requirement:carpentry:basic',
+            },
+            {
+                'id': 'craft:tailoring:tear-cloth', 'name': 'Tear Cloth',
+                'materials': [{'item': 'item:tailoring:cloth', 'qty': 1}],
+                'outputs': [{'item': 'item:tailoring:rag', 'qty': 2}],
+                'requirement': 'requirement:tailoring:basic',
+            },
+        ],
+        'requirements': [
+            {'id': 'requirement:carpentry:basic', 'name': 'Basic Carpentry',
+             'profession': {'name': 'profession:carpentry', 'level': 1}},
+            {'id': 'requirement:tailoring:basic', 'name': 'Basic Tailoring',
+             'profession': {'name': 'profession:tailoring', 'level': 1}},
+        ],
+        'professions': [
+            {'id': 'profession:carpentry', 'name': 'Carpentry'},
+            {'id': 'profession:tailoring', 'name': 'Tailoring'},
+        ],
+        'tools': [],
+        'buildings': [],
+    }
+
+
+def empty_changes():
+    """Change sets with nothing in them, shaped like compare_entities/compare_requirements output."""
+    changes = {
+        'items': {'new': {}, 'updated': {}, 'id_updates': {}},
+        'crafts': {'new': {}, 'updated': {}},
+    }
+    requirement_changes = {'new': {}, 'updated': {}, 'existing': {}}
+    return changes, requirement_changes
+
+
+def validate(data, touched_ids=None):
+    """Run the validator over a copy of the data and return its errors."""
+    data = copy.deepcopy(data)
+    validator = DataIntegrityValidator(
+        data['items'], data['crafts'], data['requirements'],
+        data['professions'], data['tools'], data['buildings'],
+    )
+    validator.run_all_validations(touched_ids)
+    return validator.errors
+
+
+def reference_errors(errors):
+    """Only the dangling item reference errors."""
+    return [error for error in errors if 'non-existent item' in error]
+
+
+@pytest.mark.unit
+class TestIncrementalValidation:
+    """Compare incremental validation against a full run."""
+
+    def test_untouched_craft_referencing_renamed_item_is_reported(self, bitcrafty_data):
+        """Test a craft left pointing at an item's old ID is checked although the craft was not touched."""
+        bitcrafty_data['items'][0]['id'] = 'item:carpentry:oak-plank'
+        changes, requirement_changes = empty_changes()
+        changes['items']['id_updates']['item:carpentry:plank'] = {
+            'new_id': 'item:carpentry:oak-plank',
+            'new': bitcrafty_data['items'][0],
+            'reason': 'renamed',
+        }
+
+        touched = _touched_entity_ids(changes, requirement_changes)
+        full = validate(bitcrafty_data)
+        incremental = validate(bitcrafty_data, touched)
+
+        assert reference_errors(full) == [
+            'Craft "craft:carpentry:make-table" references non-existent item "item:carpentry:plank" in materials'
+        ]
+        assert reference_errors(incremental) == reference_errors(full)
+
+    def test_updated_craft_referencing_removed_item_is_reported(self, bitcrafty_data):
+        """Test a craft rewritten by the reconciliation (e.g. remapped references) is checked."""
+        del bitcrafty_data['items'][3]  # item:tailoring:rag no longer exists
+        changes, requirement_changes = empty_changes()
+        tear_cloth = bitcrafty_data['crafts'][1]
+        changes['crafts']['updated'][tear_cloth['id']] = {'existing': tear_cloth, 'new': tear_cloth}
+
+        touched = _touched_entity_ids(changes, requirement_changes)
+        full = validate(bitcrafty_data)
+        incremental = validate(bitcrafty_data, touched)
+
+        assert reference_errors(full)
+        assert reference_errors(incremental) == reference_errors(full)
+
+    def test_craft_referencing_touched_item_is_checked(self, bitcrafty_data):
+        """Test an untouched craft is revalidated when an item it uses was touched."""
+        bitcrafty_data['crafts'][0]['outputs'].append({'item': 'item:carpentry:chair', 'qty': 1})
+        changes, requirement_changes = empty_changes()
+        changes['items']['updated']['item:carpentry:plank'] = {
+            'existing': bitcrafty_data['items'][0], 'new': bitcrafty_data['items'][0],
+        }
+
+        touched = _touched_entity_ids(changes, requirement_changes)
+
+        assert reference_errors(validate(bitcrafty_data, touched)) == reference_errors(validate(bitcrafty_data))
+
+    def test_incremental_errors_are_a_subset_of_full_errors(self, bitcrafty_data):
+        """Test incremental validation never reports anything a full run would not."""
+        bitcrafty_data['crafts'][1]['materials'][0]['item'] = 'item:tailoring:missing'
+        bitcrafty_data['items'].append({'id': 'item:carpentry:plank', 'name': 'Plank'})
+        changes, requirement_changes = empty_changes()
+        changes['crafts']['new']['craft:carpentry:make-table'] = bitcrafty_data['crafts'][0]
+
+        full = validate(bitcrafty_data)
+        incremental = validate(bitcrafty_data, _touched_entity_ids(changes, requirement_changes))
+
+        assert set(incremental) <= set(full)
+        # Cross-entity checks always run in full
+        assert 'Duplicate ID found: item:carpentry:plank' in incremental
+
+    def test_touching_everything_matches_full_validation(self, bitcrafty_data):
+        """Test touched_ids covering every entity gives the full result."""
+        bitcrafty_data['crafts'][1]['outputs'][0]['item'] = 'item:tailoring:missing'
+        all_ids = {
+            entity['id']
+            for key in ('items', 'crafts', 'requirements')
+            for entity in bitcrafty_data[key]
+        }
+
+        assert validate(bitcrafty_data, all_ids) == validate(bitcrafty_data)
+
+
+@pytest.mark.unit
+class TestEntryIndex:
+    """Test the ID -> positions index kept while applying changes."""
+
+    def test_reindex_moves_first_position(self):
+        """Test renaming moves the first matching position and keeps positions sorted."""
+        entries = [{'id': 'a'}, {'id': 'b'}, {'id': 'a'}]
+        index = _index_entries_by_id(entries)
+
+        assert _reindex_entry(index, 'a', 'b') == 0
+        assert index['a'] == [2]
+        assert index['b'] == [0, 1]
+        assert _reindex_entry(index, 'missing', 'c') is None
+
+    def test_replace_entry_keeps_index_in_step(self):
+        """Test replacing an entry under a new ID updates the index."""
+        entries = [{'id': 'a'}, {'id': 'b'}]
+        index = _index_entries_by_id(entries)
+
+        assert _replace_entry(entries, index, 'a', {'id': 'c'})
+        assert entries == [{'id': 'c'}, {'id': 'b'}]
+        assert 'a' not in index
+        assert index['c'] == [0]
+        assert not _replace_entry(entries, index, 'a', {'id': 'd'})
+
+
+@pytest.mark.unit
+class TestRequirementReferences:
+    """Test requirement reference validation."""
+
+    def test_null_tool_and_building_are_treated_as_absent(self, bitcrafty_data):
+        """Test "tool": null and "building": null validate like missing keys."""
+        bitcrafty_data['requirements'][0].update(tool=None, building=None)
+
+        assert validate(bitcrafty_data) == []
+
+    def test_null_profession_is_reported_as_missing(self, bitcrafty_data):
+        """Test a null profession reports the missing profession instead of raising."""
+        bitcrafty_data['requirements'][0]['profession'] = None
+
+        assert 'Requirement "requirement:carpentry:basic" is missing profession.name' in validate(bitcrafty_data)
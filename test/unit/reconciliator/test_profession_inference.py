@@ -0,0 +1,67 @@
+"""
+Unit tests for reconciliator profession inference.
+
+infer_profession_from_item_name must keep the substring semantics of the
+original if/elif keyword checks, since items without an inferred profession
+are skipped and the inferred profession becomes part of the BitCrafty ID.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "reconciliator"))
+
+from reconciliator import infer_profession_from_item_name
+
+
+def original_infer_profession(item_name):
+    """Reference copy of the original keyword checks."""
+    name_lower = item_name.lower()
+    if any(word in name_lower for word in ['wood', 'log', 'trunk', 'stripped', 'plank']):
+        return 'carpentry'
+    elif any(word in name_lower for word in ['thread', 'spool', 'cloth', 'fabric']):
+        return 'tailoring'
+    elif any(word in name_lower for word in ['mushroom', 'berry', 'fruit', 'vegetable']):
+        return 'foraging'
+    elif any(word in name_lower for word in ['clay', 'stone', 'ore', 'metal', 'pot', 'brick', 'glass']):
+        return 'mining'
+    elif any(word in name_lower for word in ['sap', 'resin']):
+        return 'forestry'
+    elif any(word in name_lower for word in ['seed', 'fertilizer', 'grain']):
+        return 'farming'
+    return None
+
+
+def exported_names():
+    """Every item, material and output name in the extractor exports."""
+    exports_dir = REPO_ROOT / "exports"
+    with open(exports_dir / "items.json", encoding="utf-8") as f:
+        names = {item['name'] for item in json.load(f)['items']}
+    with open(exports_dir / "crafts.json", encoding="utf-8") as f:
+        for craft in json.load(f)['crafts']:
+            for entry in craft.get('materials', []) + craft.get('outputs', []):
+                names.add(entry['item'])
+    return sorted(names)
+
+
+@pytest.mark.unit
+class TestInferProfessionFromItemName:
+    """Test the keyword-based profession inference."""
+
+    def test_matches_original_on_exported_names(self):
+        """Test every exported name infers the same profession as the original checks."""
+        for name in exported_names():
+            assert infer_profession_from_item_name(name) == original_infer_profession(name), name
+
+    @pytest.mark.parametrize("name", [
+        "Woodcutter's Axe", "Glassware", "Stonework", "Potion", "Sapphire",
+        "Oregano", "Potato", "Sapling", "Berries", "Teapot", "Embergrain",
+        "Clay Pot", "Plain Stripped Wood", "Rough Cloth", "Unknown Thing",
+    ])
+    def test_matches_original_on_substring_cases(self, name):
+        """Test keywords inside longer words still match, and nothing else does."""
+        assert infer_profession_from_item_name(name) == original_infer_profession(name)